@@ -1,9 +1,24 @@
 """Python SDK entrypoint for the agent tracing library."""
 
-from traccia.auto import start_tracing, stop_tracing, init, trace, end_auto_trace
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from traccia.tracer import TracerProvider
 from traccia.instrumentation.decorator import observe
 
+if TYPE_CHECKING:
+    from traccia.auto import start_tracing, stop_tracing, init, trace, end_auto_trace
+
+# traccia.auto pulls in config loading (pydantic, TOML) and the exporters; it is
+# resolved on first access (PEP 562) so a bare `import traccia` stays cheap.
+_LAZY_IMPORTS = {
+    "start_tracing": "traccia.auto",
+    "stop_tracing": "traccia.auto",
+    "init": "traccia.auto",
+    "trace": "traccia.auto",
+    "end_auto_trace": "traccia.auto",
+}
+
 # Version exposure
 try:
     from importlib.metadata import version, PackageNotFoundError
@@ -71,3 +86,16 @@ __all__ = [
     "observe",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
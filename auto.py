@@ -6,7 +6,6 @@ import atexit
 import inspect
 import os
 import sys
-from pathlib import Path
 from typing import Optional, Any
 
 from traccia.exporter import HttpExporter, ConsoleExporter, FileExporter, OTLPExporter
@@ -83,7 +82,9 @@ def init(
     
     # Load config file if exists (lowest priority)
     merged_config = {}
-    if config_file or sdk_config.find_config_file():
+    # Resolve the file once here so load_config() doesn't search again
+    config_file = config_file or sdk_config.find_config_file()
+    if config_file:
         file_config = sdk_config.load_config_with_priority(config_file=config_file)
         merged_config.update(file_config)
     
@@ -99,7 +100,7 @@ def init(
     final_auto_start = merged_config.pop('auto_start_trace', auto_start_trace)
     if isinstance(final_auto_start, str):
         # Convert string to bool if needed
-        final_auto_start = final_auto_start.lower() in ('true', '1', 'yes')
+        final_auto_start = sdk_config._to_bool(final_auto_start)
     
     # Store auto-trace config before calling start_tracing
     _auto_trace_name = merged_config.pop('auto_trace_name', auto_trace_name)
@@ -237,7 +238,7 @@ class trace:
         self.name = name
         self.kwargs = kwargs
         self.span = None
-        self.token = None
+        self.scope = None
     
     def __enter__(self):
         """Start the explicit trace."""
@@ -260,10 +261,10 @@ class trace:
             )
             
             # Make this span the current span
-            from opentelemetry import context
-            from opentelemetry.trace import set_span_in_context
+            from traccia.context import span_scope
             
-            self.token = context.attach(set_span_in_context(self.span._otel_span))
+            self.scope = span_scope(self.span)
+            self.scope.__enter__()
             
             return self.span
         
@@ -285,10 +286,9 @@ class trace:
             except Exception:
                 pass
         
-        if self.token:
+        if self.scope:
             try:
-                from opentelemetry import context
-                context.detach(self.token)
+                self.scope.__exit__(exc_type, exc_val, exc_tb)
             except Exception:
                 pass
         
@@ -320,7 +320,8 @@ def start_tracing(
     auto_instrument_tools: bool = False,
     tool_include: Optional[list] = None,
     max_tool_spans: int = 100,
-    max_span_depth: int = 10,
+    max_span_depth: Optional[int] = None,
+    trace_result: bool = True,
     session_id: Optional[str] = None,
     user_id: Optional[str] = None,
     tenant_id: Optional[str] = None,
@@ -383,6 +384,7 @@ def start_tracing(
     runtime_config.set_tool_include(tool_include or [])
     runtime_config.set_max_tool_spans(max_tool_spans)
     runtime_config.set_max_span_depth(max_span_depth)
+    runtime_config.set_trace_result(trace_result)
     runtime_config.set_session_id(session_id)
     runtime_config.set_user_id(user_id)
     runtime_config.set_tenant_id(_resolve_tenant_id(tenant_id))
@@ -621,15 +623,15 @@ def _resolve_service_name(service_name: Optional[str]) -> str:
     if env_name:
         return env_name
     # Use current working directory name
-    cwd_name = Path.cwd().name
+    cwd_name = os.path.basename(os.getcwd())
     if cwd_name:
         return cwd_name
     # Infer from entry script if available (e.g., "app.py" -> "app")
     argv0 = sys.argv[0] if sys.argv else ""
     if argv0 and argv0 not in ("-c", "-m"):
-        script_name = Path(argv0).name
+        script_name = os.path.basename(argv0)
         if script_name:
-            return Path(script_name).stem or script_name
+            return os.path.splitext(script_name)[0] or script_name
     return "traccia_app"
 
 
@@ -647,24 +649,26 @@ def _resolve_agent_config_path() -> Optional[str]:
       3) Try to find agent_config.json adjacent to the first non-sdk caller
     """
     env_path = os.getenv("AGENT_DASHBOARD_AGENT_CONFIG")
-    if env_path:
-        path = Path(env_path)
-        if path.exists():
-            return str(path.resolve())
+    if env_path and os.path.exists(env_path):
+        return os.path.realpath(env_path)
 
-    cwd_path = Path.cwd() / "agent_config.json"
-    if cwd_path.exists():
-        return str(cwd_path.resolve())
+    cwd_path = os.path.join(os.getcwd(), "agent_config.json")
+    if os.path.exists(cwd_path):
+        return os.path.realpath(cwd_path)
 
     try:
-        for frame in inspect.stack():
-            frame_path = Path(frame.filename)
+        # Walk frames directly; inspect.stack() would also load source
+        # context lines for every frame
+        frame = inspect.currentframe()
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            frame = frame.f_back
             # Skip SDK internal files
-            if "traccia" in frame_path.parts:
+            if "traccia" in filename.split(os.sep):
                 continue
-            candidate = frame_path.parent / "agent_config.json"
-            if candidate.exists():
-                return str(candidate.resolve())
+            candidate = os.path.join(os.path.dirname(filename), "agent_config.json")
+            if os.path.exists(candidate):
+                return os.path.realpath(candidate)
     except Exception:
         return None
     return None
@@ -14,24 +14,43 @@ If a target can't be resolved or isn't callable, it's skipped.
 
 from __future__ import annotations
 
+import functools
 import importlib
+import sys
+from types import ModuleType
 from typing import Iterable, Optional, Tuple
 
 from traccia.instrumentation.decorator import observe
 from traccia import runtime_config
 
 
+@functools.lru_cache(maxsize=512)
 def _split_target(spec: str) -> Optional[Tuple[str, str]]:
     if not spec:
         return None
     if ":" in spec:
-        mod, attr = spec.split(":", 1)
-        return mod.strip(), attr.strip()
-    # Heuristic: last segment is the attribute name; rest is module
-    if "." not in spec:
+        mod, _, attr = spec.partition(":")
+    else:
+        # Heuristic: last segment is the attribute name; rest is module
+        mod, _, attr = spec.rpartition(".")
+    mod, attr = mod.strip(), attr.strip()
+    if not mod or not attr:
         return None
-    mod, attr = spec.rsplit(".", 1)
-    return mod.strip(), attr.strip()
+    return mod, attr
+
+
+def _cached_import_module(module_name: str) -> ModuleType:
+    """
+    Return an already-loaded module straight from sys.modules.
+
+    Falls back to importlib for modules that aren't loaded yet or are still
+    initializing, skipping the import machinery on the common path.
+    """
+    mod = sys.modules.get(module_name)
+    spec = getattr(mod, "__spec__", None)
+    if mod is None or spec is None or getattr(spec, "_initializing", False):
+        mod = importlib.import_module(module_name)
+    return mod
 
 
 def instrument_functions(include: Iterable[str]) -> None:
@@ -49,7 +68,7 @@ def instrument_functions(include: Iterable[str]) -> None:
             continue
         module_name, attr_name = parsed
         try:
-            mod = importlib.import_module(module_name)
+            mod = _cached_import_module(module_name)
         except Exception:
             continue
 
@@ -139,8 +139,11 @@ auto_instrument_tools = false
 # Maximum number of tool spans to create
 max_tool_spans = 100
 
-# Maximum depth of nested spans
-max_span_depth = 10
+# Maximum depth of nested @observe spans (uncomment to enable; unlimited by default)
+# max_span_depth = 10
+
+# Record @observe return values (false records only the result type name)
+trace_result = true
 
 [rate_limiting]
 # Maximum spans per second (uncomment to enable rate limiting)
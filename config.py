@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
-from pathlib import Path
-from typing import Any, Dict, Optional, Literal
-from pydantic import BaseModel, Field, field_validator, model_validator, HttpUrl
+import stat
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Literal, Tuple
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, HttpUrl
 
 from traccia.errors import ConfigError, ValidationError
 
@@ -34,6 +37,7 @@ ENV_VAR_MAPPING = {
     "auto_instrument_tools": ["TRACCIA_AUTO_INSTRUMENT_TOOLS"],
     "max_tool_spans": ["TRACCIA_MAX_TOOL_SPANS"],
     "max_span_depth": ["TRACCIA_MAX_SPAN_DEPTH"],
+    "trace_result": ["TRACCIA_TRACE_RESULT"],
     "openai_agents": ["TRACCIA_OPENAI_AGENTS"],
     "crewai": ["TRACCIA_CREWAI"],
     
@@ -60,7 +64,18 @@ ENV_VAR_MAPPING = {
 }
 
 
-class TracingConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """
+    Base for the config models.
+    
+    Configs are read-only once loaded, so instances are frozen (no per-assignment
+    plumbing); unknown keys are ignored rather than collected.
+    """
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class TracingConfig(_ConfigModel):
     """Tracing configuration section."""
     
     api_key: Optional[str] = Field(
@@ -95,7 +110,7 @@ class TracingConfig(BaseModel):
     )
 
 
-class ExporterConfig(BaseModel):
+class ExporterConfig(_ConfigModel):
     """Exporter configuration section."""
     
     enable_console: bool = Field(
@@ -134,7 +149,7 @@ class ExporterConfig(BaseModel):
         return self
 
 
-class InstrumentationConfig(BaseModel):
+class InstrumentationConfig(_ConfigModel):
     """Instrumentation configuration section."""
     
     enable_patching: bool = Field(
@@ -158,10 +173,14 @@ class InstrumentationConfig(BaseModel):
         gt=0,
         description="Maximum number of tool spans to create"
     )
-    max_span_depth: int = Field(
-        default=10,
+    max_span_depth: Optional[int] = Field(
+        default=None,
         gt=0,
-        description="Maximum depth of nested spans"
+        description="Maximum depth of nested @observe spans (None = unlimited)"
+    )
+    trace_result: bool = Field(
+        default=True,
+        description="Record @observe return values (False = record only the result type name)"
     )
     openai_agents: bool = Field(
         default=True,
@@ -173,7 +192,7 @@ class InstrumentationConfig(BaseModel):
     )
 
 
-class RateLimitConfig(BaseModel):
+class RateLimitConfig(_ConfigModel):
     """Rate limiting and batching configuration section."""
     
     max_spans_per_second: Optional[float] = Field(
@@ -203,7 +222,7 @@ class RateLimitConfig(BaseModel):
     )
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging configuration section."""
     
     debug: bool = Field(
@@ -216,7 +235,7 @@ class LoggingConfig(BaseModel):
     )
 
 
-class RuntimeConfig(BaseModel):
+class RuntimeConfig(_ConfigModel):
     """Runtime metadata configuration section."""
     
     session_id: Optional[str] = Field(
@@ -241,7 +260,7 @@ class RuntimeConfig(BaseModel):
     )
 
 
-class AdvancedConfig(BaseModel):
+class AdvancedConfig(_ConfigModel):
     """Advanced configuration options."""
     
     attr_truncation_limit: Optional[int] = Field(
@@ -251,7 +270,7 @@ class AdvancedConfig(BaseModel):
     )
 
 
-class TracciaConfig(BaseModel):
+class TracciaConfig(_ConfigModel):
     """
     Complete Traccia SDK configuration.
     
@@ -288,46 +307,10 @@ class TracciaConfig(BaseModel):
     
     def to_flat_dict(self) -> Dict[str, Any]:
         """Convert to flat dictionary for backward compatibility."""
+        # One pass over the static flat key -> (section, key) table
         return {
-            # Tracing
-            "api_key": self.tracing.api_key,
-            "endpoint": self.tracing.endpoint,
-            "sample_rate": self.tracing.sample_rate,
-            "auto_start_trace": self.tracing.auto_start_trace,
-            "auto_trace_name": self.tracing.auto_trace_name,
-            "use_otlp": self.tracing.use_otlp,
-            "service_name": self.tracing.service_name,
-            # Exporters
-            "enable_console": self.exporters.enable_console,
-            "enable_file": self.exporters.enable_file,
-            "file_exporter_path": self.exporters.file_exporter_path,
-            "reset_trace_file": self.exporters.reset_trace_file,
-            # Instrumentation
-            "enable_patching": self.instrumentation.enable_patching,
-            "enable_token_counting": self.instrumentation.enable_token_counting,
-            "enable_costs": self.instrumentation.enable_costs,
-            "auto_instrument_tools": self.instrumentation.auto_instrument_tools,
-            "max_tool_spans": self.instrumentation.max_tool_spans,
-            "max_span_depth": self.instrumentation.max_span_depth,
-            "openai_agents": self.instrumentation.openai_agents,
-            "crewai": self.instrumentation.crewai,
-            # Rate limiting & Batching
-            "max_spans_per_second": self.rate_limiting.max_spans_per_second,
-            "max_queue_size": self.rate_limiting.max_queue_size,
-            "max_block_ms": self.rate_limiting.max_block_ms,
-            "max_export_batch_size": self.rate_limiting.max_export_batch_size,
-            "schedule_delay_millis": self.rate_limiting.schedule_delay_millis,
-            # Runtime
-            "session_id": self.runtime.session_id,
-            "user_id": self.runtime.user_id,
-            "tenant_id": self.runtime.tenant_id,
-            "project_id": self.runtime.project_id,
-            "agent_id": self.runtime.agent_id,
-            # Logging
-            "debug": self.logging.debug,
-            "enable_span_logging": self.logging.enable_span_logging,
-            # Advanced
-            "attr_truncation_limit": self.advanced.attr_truncation_limit,
+            key: getattr(getattr(self, section), nested_key)
+            for key, (section, nested_key) in _FLAT_TO_NESTED.items()
         }
 
 
@@ -352,7 +335,15 @@ def load_dotenv(path: str = ".env") -> None:
         return
 
 
-def find_config_file() -> Optional[str]:
+def _is_regular_file(path: str) -> bool:
+    """Single stat() per candidate; missing or unreadable paths are not files."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def find_config_file(cwd: Optional[str] = None, home: Optional[str] = None) -> Optional[str]:
     """
     Find traccia.toml config file in standard locations.
     
@@ -360,57 +351,127 @@ def find_config_file() -> Optional[str]:
     1. ./traccia.toml (current directory)
     2. ~/.traccia/config.toml (user home)
     
+    Args:
+        cwd: Directory to use instead of the current working directory
+        home: Directory to use instead of the user's home directory
+    
     Returns:
         Path to config file if found, None otherwise
     """
     # Check current directory
-    cwd_config = Path.cwd() / "traccia.toml"
-    if cwd_config.exists():
-        return str(cwd_config)
+    cwd_config = os.path.join(cwd if cwd is not None else os.getcwd(), "traccia.toml")
+    if _is_regular_file(cwd_config):
+        return cwd_config
     
     # Check user home directory
-    home_config = Path.home() / ".traccia" / "config.toml"
-    if home_config.exists():
-        return str(home_config)
+    if home is None:
+        home = os.path.expanduser("~")
+    home_config = os.path.join(home, ".traccia", "config.toml")
+    if _is_regular_file(home_config):
+        return home_config
     
     return None
 
 
+# TOML backends in order of preference: the compiled parsers from the
+# fast-toml extra first, then stdlib tomllib (3.11+), tomli and toml.
+_TOML_BACKENDS = ("rtoml", "pytomlpp", "tomllib", "tomli", "toml")
+
+
+# Decode-error classes exposed by the backends; all but pytomlpp's also
+# subclass ValueError
+_TOML_ERROR_NAMES = ("TOMLDecodeError", "TomlDecodeError", "TomlParsingError", "DecodeError")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_toml_backend() -> Tuple[Callable[[str], Dict[str, Any]], Tuple[type, ...]]:
+    """Resolve the fastest available TOML parser and its decode errors once."""
+    import importlib
+    
+    for module_name in _TOML_BACKENDS:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        errors = tuple(
+            error for error in (getattr(module, name, None) for name in _TOML_ERROR_NAMES)
+            if isinstance(error, type) and issubclass(error, Exception)
+        )
+        return module.loads, (ValueError,) + errors
+    raise ConfigError(
+        "No TOML library available. Install tomli or toml: pip install tomli"
+    )
+
+
+# Parsed config files keyed by (real path, mtime_ns, size); FIFO-capped
+_TOML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_TOML_CACHE_MAX_ENTRIES = 32
+
+
 def load_toml_config(path: str) -> Dict[str, Any]:
     """
     Load configuration from a TOML file.
     
+    The file is read in a single call and parsed from memory; an empty file
+    short-circuits to an empty config without touching the parser. Parsed
+    files are cached until their mtime or size changes.
+    
     Args:
         path: Path to the TOML config file
         
     Returns:
         Dictionary with nested config structure
     """
-    if not os.path.exists(path):
-        return {}
+    # Callers own the returned dict, so never hand out the cached one
+    return copy.deepcopy(_load_toml_cached(path))
+
+
+def _load_toml_cached(path: str) -> Dict[str, Any]:
+    """
+    Cached body of load_toml_config().
     
+    The result is shared with the cache and must not be mutated; merge_configs()
+    only copies from it, so load_config() can use it directly.
+    """
     try:
-        # Try to import tomli for Python 3.11+, fall back to toml
-        try:
-            import tomli as toml_lib
-            with open(path, "rb") as f:
-                data = toml_lib.load(f)
-        except ImportError:
-            try:
-                import toml as toml_lib  # type: ignore
-                with open(path, "r", encoding="utf-8") as f:
-                    data = toml_lib.load(f)
-            except ImportError:
-                raise ConfigError(
-                    "No TOML library available. Install tomli or toml: pip install tomli"
-                )
-        
-        return data
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        raise ConfigError(f"Failed to load config file: {e}")
     
-    except Exception as e:
-        if isinstance(e, ConfigError):
-            raise
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    cached = _TOML_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    data = _parse_toml_file(path)
+    if len(_TOML_CACHE) >= _TOML_CACHE_MAX_ENTRIES:
+        _TOML_CACHE.pop(next(iter(_TOML_CACHE)), None)
+    _TOML_CACHE[key] = data
+    return data
+
+
+def _parse_toml_file(path: str) -> Dict[str, Any]:
+    """Read and parse a TOML file without caching."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
         raise ConfigError(f"Failed to load config file: {e}")
+    
+    # isspace() checks in place; strip() would copy the whole file first
+    if not data or data.isspace():
+        return {}
+    
+    toml_loads, decode_errors = _get_toml_backend()
+    try:
+        # UnicodeDecodeError is a ValueError, so bad encodings land here too
+        return toml_loads(data.decode("utf-8"))
+    except decode_errors as e:
+        raise ConfigError(f"Invalid TOML in {path}: {e}") from e
 
 
 def get_env_value(config_key: str) -> Optional[str]:
@@ -427,111 +488,130 @@ def get_env_value(config_key: str) -> Optional[str]:
     return None
 
 
+# Coercers are module-level so the env table references them by name; anything
+# outside _TRUE_VALUES reads as False, as it always has
+_TRUE_VALUES = frozenset(("true", "1", "yes"))
+
+
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _to_optional_float(value: str) -> Optional[float]:
+    return float(value) if value else None
+
+
+_MUST_BE_INTEGER = "Must be an integer."
+_MUST_BE_NUMBER = "Must be a number."
+
+# (section, key, coercer or None for plain strings, hint for invalid values),
+# in TracciaConfig field order. Also the source of the flat <-> nested key
+# mapping used by to_flat_dict() and load_config_with_priority().
+_ENV_FIELDS = (
+    ("tracing", "api_key", None, None),
+    ("tracing", "endpoint", None, None),
+    ("tracing", "sample_rate", float, "Must be a float between 0.0 and 1.0."),
+    ("tracing", "auto_start_trace", _to_bool, None),
+    ("tracing", "auto_trace_name", None, None),
+    ("tracing", "use_otlp", _to_bool, None),
+    ("tracing", "service_name", None, None),
+    ("exporters", "enable_console", _to_bool, None),
+    ("exporters", "enable_file", _to_bool, None),
+    ("exporters", "file_exporter_path", None, None),
+    ("exporters", "reset_trace_file", _to_bool, None),
+    ("instrumentation", "enable_patching", _to_bool, None),
+    ("instrumentation", "enable_token_counting", _to_bool, None),
+    ("instrumentation", "enable_costs", _to_bool, None),
+    ("instrumentation", "auto_instrument_tools", _to_bool, None),
+    ("instrumentation", "max_tool_spans", int, _MUST_BE_INTEGER),
+    ("instrumentation", "max_span_depth", int, _MUST_BE_INTEGER),
+    ("instrumentation", "trace_result", _to_bool, None),
+    ("instrumentation", "openai_agents", _to_bool, None),
+    ("instrumentation", "crewai", _to_bool, None),
+    ("rate_limiting", "max_spans_per_second", _to_optional_float, _MUST_BE_NUMBER),
+    ("rate_limiting", "max_queue_size", int, _MUST_BE_NUMBER),
+    ("rate_limiting", "max_block_ms", int, _MUST_BE_NUMBER),
+    ("rate_limiting", "max_export_batch_size", int, _MUST_BE_NUMBER),
+    ("rate_limiting", "schedule_delay_millis", int, _MUST_BE_NUMBER),
+    ("runtime", "session_id", None, None),
+    ("runtime", "user_id", None, None),
+    ("runtime", "tenant_id", None, None),
+    ("runtime", "project_id", None, None),
+    ("runtime", "agent_id", None, None),
+    ("logging", "debug", _to_bool, None),
+    ("logging", "enable_span_logging", _to_bool, None),
+    ("advanced", "attr_truncation_limit", int, _MUST_BE_INTEGER),
+)
+
+# Same table with the candidate env var names resolved once at import
+_ENV_SPEC = tuple(
+    (section, key, tuple(ENV_VAR_MAPPING[key]), coerce, hint)
+    for section, key, coerce, hint in _ENV_FIELDS
+)
+
+
+# Last (raw env values, parsed nested config) pair seen by load_config_from_env()
+_ENV_CACHE: Optional[Tuple[Tuple[Tuple[int, str], ...], Dict[str, Dict[str, Any]]]] = None
+
+
 def load_config_from_env(flat: bool = False) -> Dict[str, Any]:
     """
     Load configuration from environment variables.
     
+    Only the known variable names are looked up, so the cost does not grow
+    with the size of the environment. The parsed result is memoized against
+    the raw values, so repeated calls with an unchanged environment skip
+    coercion and validation.
+    
     Args:
         flat: If True, return flat dictionary for backward compatibility
     
     Returns:
         Dictionary of config values from environment (nested structure by default)
     """
-    env_config = {
-        "tracing": {},
-        "exporters": {},
-        "instrumentation": {},
-        "rate_limiting": {},
-        "runtime": {},
-        "logging": {},
-        "advanced": {},
-    }
-    
-    # Tracing section
-    for key in ["api_key", "endpoint", "sample_rate", "auto_start_trace", "auto_trace_name", "use_otlp", "service_name"]:
-        value = get_env_value(key)
-        if value is not None:
-            # Convert string to appropriate type
-            if key in ["auto_start_trace", "use_otlp"]:
-                env_config["tracing"][key] = value.lower() in ("true", "1", "yes")
-            elif key == "sample_rate":
-                try:
-                    env_config["tracing"][key] = float(value)
-                except ValueError:
-                    raise ConfigError(f"Invalid sample_rate value: {value}. Must be a float between 0.0 and 1.0.")
-            else:
-                env_config["tracing"][key] = value
-    
-    # Exporters section
-    for key in ["enable_console", "enable_file", "file_exporter_path", "reset_trace_file"]:
-        value = get_env_value(key)
-        if value is not None:
-            if key in ["enable_console", "enable_file", "reset_trace_file"]:
-                env_config["exporters"][key] = value.lower() in ("true", "1", "yes")
-            else:
-                env_config["exporters"][key] = value
-    
-    # Instrumentation section
-    for key in ["enable_patching", "enable_token_counting", "enable_costs", "auto_instrument_tools", "openai_agents", "crewai"]:
-        value = get_env_value(key)
-        if value is not None:
-            env_config["instrumentation"][key] = value.lower() in ("true", "1", "yes")
-    
-    for key in ["max_tool_spans", "max_span_depth"]:
-        value = get_env_value(key)
-        if value is not None:
-            try:
-                env_config["instrumentation"][key] = int(value)
-            except ValueError:
-                raise ConfigError(f"Invalid {key} value: {value}. Must be an integer.")
-    
-    # Rate limiting section
-    for key in ["max_spans_per_second"]:
-        value = get_env_value(key)
-        if value is not None:
-            try:
-                env_config["rate_limiting"][key] = float(value) if value else None
-            except ValueError:
-                raise ConfigError(f"Invalid {key} value: {value}. Must be a number.")
-    
-    for key in ["max_queue_size", "max_block_ms", "max_export_batch_size", "schedule_delay_millis"]:
-        value = get_env_value(key)
-        if value is not None:
-            try:
-                env_config["rate_limiting"][key] = int(value)
-            except ValueError:
-                raise ConfigError(f"Invalid {key} value: {value}. Must be a number.")
-    
-    # Runtime section
-    for key in ["session_id", "user_id", "tenant_id", "project_id", "agent_id"]:
-        value = get_env_value(key)
-        if value is not None:
-            env_config["runtime"][key] = value
-    
-    # Logging section
-    for key in ["debug", "enable_span_logging"]:
-        value = get_env_value(key)
-        if value is not None:
-            env_config["logging"][key] = value.lower() in ("true", "1", "yes")
-    
-    # Advanced section
-    value = get_env_value("attr_truncation_limit")
-    if value is not None:
-        try:
-            env_config["advanced"]["attr_truncation_limit"] = int(value)
-        except ValueError:
-            raise ConfigError(f"Invalid attr_truncation_limit value: {value}. Must be an integer.")
-    
-    # Remove empty sections
-    nested_result = {k: v for k, v in env_config.items() if v}
+    global _ENV_CACHE
+    
+    getenv = os.environ.get
+    raw_values = []
+    for index, (_, _, env_vars, _, _) in enumerate(_ENV_SPEC):
+        for env_var in env_vars:
+            value = getenv(env_var)
+            if value is not None:
+                raw_values.append((index, value))
+                break
+    raw_key = tuple(raw_values)
+    
+    cached = _ENV_CACHE
+    if cached is not None and cached[0] == raw_key:
+        nested_result = cached[1]
+    else:
+        nested_result = _parse_env_values(raw_key)
+        _ENV_CACHE = (raw_key, nested_result)
     
-    # Flatten if requested (for backward compatibility)
+    # Hand out copies; the cached sections must stay untouched
     if flat:
-        flat_result = {}
-        for section, values in nested_result.items():
+        flat_result: Dict[str, Any] = {}
+        for values in nested_result.values():
             flat_result.update(values)
         return flat_result
-    
+    return {section: dict(values) for section, values in nested_result.items()}
+
+
+def _parse_env_values(raw_values: Tuple[Tuple[int, str], ...]) -> Dict[str, Dict[str, Any]]:
+    """Coerce (index into _ENV_SPEC, raw value) pairs into nested config sections."""
+    nested_result: Dict[str, Dict[str, Any]] = {}
+    for index, value in raw_values:
+        section, key, _, coerce, hint = _ENV_SPEC[index]
+        if coerce is not None:
+            try:
+                value = coerce(value)
+            except ValueError:
+                raise ConfigError(f"Invalid {key} value: {value}. {hint}")
+        
+        section_values = nested_result.get(section)
+        if section_values is None:
+            section_values = nested_result[section] = {}
+        section_values[key] = value
     return nested_result
 
 
@@ -578,22 +658,16 @@ def load_config(
     Raises:
         ConfigError: If configuration is invalid or conflicting
     """
-    merged_config: Dict[str, Any] = {}
-    
     # 1. Load from config file (lowest priority)
-    if config_file:
-        file_config = load_toml_config(config_file)
-        merged_config = merge_configs(merged_config, file_config)
-    else:
+    if not config_file:
         # Try to find config file automatically
-        found_config = find_config_file()
-        if found_config:
-            file_config = load_toml_config(found_config)
-            merged_config = merge_configs(merged_config, file_config)
+        config_file = find_config_file()
+    merged_config: Dict[str, Any] = dict(_load_toml_cached(config_file)) if config_file else {}
     
     # 2. Override with environment variables (medium priority)
     env_config = load_config_from_env()
-    merged_config = merge_configs(merged_config, env_config)
+    if env_config:
+        merged_config = merge_configs(merged_config, env_config)
     
     # 3. Override with explicit parameters (highest priority)
     if overrides:
@@ -632,74 +706,90 @@ def validate_config(
 
 
 # Backward compatibility functions
+
+# Flat (legacy) key -> (section, key) in the nested config
+_FLAT_TO_NESTED = {key: (section, key) for section, key, _, _ in _ENV_FIELDS}
+
+
+class FlatConfig(Mapping):
+    """
+    Immutable flat view of a validated TracciaConfig.
+    
+    Fields are slots, so `config.sample_rate` is a plain attribute load; the
+    read-only mapping interface (`config["sample_rate"]`, `.get()`, `dict(config)`)
+    is kept for code written against the old dict return value.
+    """
+    
+    __slots__ = tuple(_FLAT_TO_NESTED)
+    
+    def __init__(self, **values: Any) -> None:
+        for key in self.__slots__:
+            object.__setattr__(self, key, values.get(key))
+    
+    @classmethod
+    def from_model(cls, config: TracciaConfig) -> "FlatConfig":
+        """Build directly from the model's sections, skipping to_flat_dict()."""
+        flat = object.__new__(cls)
+        set_field = object.__setattr__
+        for key, (section, nested_key) in _FLAT_TO_NESTED.items():
+            set_field(flat, key, getattr(getattr(config, section), nested_key))
+        return flat
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # The default slot restore goes through __setattr__, which always raises
+        return (self.__class__, (), tuple(getattr(self, key) for key in self.__slots__))
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        set_field = object.__setattr__
+        for key, value in zip(self.__slots__, state):
+            set_field(self, key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FLAT_TO_NESTED:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
 def load_config_with_priority(
     config_file: Optional[str] = None,
     overrides: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
+) -> FlatConfig:
     """
     Legacy function for backward compatibility.
     
-    Returns flattened config dictionary instead of Pydantic model.
+    Returns a flat, read-only FlatConfig instead of the Pydantic model.
     Accepts flat overrides and converts them to nested format.
     """
-    # Convert flat overrides to nested format
+    # Convert flat overrides to nested format; only sections that receive
+    # a value are created
     nested_overrides = None
     if overrides:
-        nested_overrides = {
-            "tracing": {}, 
-            "exporters": {}, 
-            "instrumentation": {}, 
-            "rate_limiting": {},
-            "runtime": {},
-            "logging": {},
-            "advanced": {}
-        }
-        
-        # Map flat keys to nested structure
-        flat_to_nested = {
-            # Tracing
-            "api_key": ("tracing", "api_key"),
-            "endpoint": ("tracing", "endpoint"),
-            "sample_rate": ("tracing", "sample_rate"),
-            "auto_start_trace": ("tracing", "auto_start_trace"),
-            "auto_trace_name": ("tracing", "auto_trace_name"),
-            "use_otlp": ("tracing", "use_otlp"),
-            "service_name": ("tracing", "service_name"),
-            # Exporters
-            "enable_console": ("exporters", "enable_console"),
-            "enable_file": ("exporters", "enable_file"),
-            "file_exporter_path": ("exporters", "file_exporter_path"),
-            "reset_trace_file": ("exporters", "reset_trace_file"),
-            # Instrumentation
-            "enable_patching": ("instrumentation", "enable_patching"),
-            "enable_token_counting": ("instrumentation", "enable_token_counting"),
-            "enable_costs": ("instrumentation", "enable_costs"),
-            "auto_instrument_tools": ("instrumentation", "auto_instrument_tools"),
-            "max_tool_spans": ("instrumentation", "max_tool_spans"),
-            "max_span_depth": ("instrumentation", "max_span_depth"),
-            # Rate limiting & Batching
-            "max_spans_per_second": ("rate_limiting", "max_spans_per_second"),
-            "max_queue_size": ("rate_limiting", "max_queue_size"),
-            "max_block_ms": ("rate_limiting", "max_block_ms"),
-            "max_export_batch_size": ("rate_limiting", "max_export_batch_size"),
-            "schedule_delay_millis": ("rate_limiting", "schedule_delay_millis"),
-            # Runtime
-            "session_id": ("runtime", "session_id"),
-            "user_id": ("runtime", "user_id"),
-            "tenant_id": ("runtime", "tenant_id"),
-            "project_id": ("runtime", "project_id"),
-            "agent_id": ("runtime", "agent_id"),
-            # Logging
-            "debug": ("logging", "debug"),
-            "enable_span_logging": ("logging", "enable_span_logging"),
-            # Advanced
-            "attr_truncation_limit": ("advanced", "attr_truncation_limit"),
-        }
-        
+        nested_overrides = {}
+        location_for = _FLAT_TO_NESTED.get
         for flat_key, value in overrides.items():
-            if flat_key in flat_to_nested:
-                section, nested_key = flat_to_nested[flat_key]
-                nested_overrides[section][nested_key] = value
+            location = location_for(flat_key)
+            if location is not None:
+                section, nested_key = location
+                section_values = nested_overrides.get(section)
+                if section_values is None:
+                    section_values = nested_overrides[section] = {}
+                section_values[nested_key] = value
     
     config = load_config(config_file=config_file, overrides=nested_overrides)
-    return config.to_flat_dict()
+    return FlatConfig.from_model(config)
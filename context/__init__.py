@@ -1,24 +1,31 @@
 """Context utilities for the tracing SDK."""
 
-from traccia.context.context import get_current_span, pop_span, push_span
-from traccia.context.propagators import (
-    extract_trace_context,
-    extract_tracestate,
-    extract_traceparent,
-    format_traceparent,
-    format_tracestate,
-    inject_traceparent,
-    inject_tracestate,
-    parse_tracestate,
-    parse_traceparent,
-    inject,
-    extract,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from traccia.context.context import get_current_span, pop_span, push_span, span_scope
+    from traccia.context.propagators import (
+        extract_trace_context,
+        extract_tracestate,
+        extract_traceparent,
+        format_traceparent,
+        format_tracestate,
+        inject_traceparent,
+        inject_tracestate,
+        parse_tracestate,
+        parse_traceparent,
+        inject,
+        extract,
+    )
 
 __all__ = [
     "get_current_span",
     "push_span",
     "pop_span",
+    "span_scope",
     "format_traceparent",
     "inject_traceparent",
     "parse_traceparent",
@@ -31,3 +38,39 @@ __all__ = [
     "inject",
     "extract",
 ]
+
+_CONTEXT_MODULE = "traccia.context.context"
+_PROPAGATORS_MODULE = "traccia.context.propagators"
+
+# Resolved on first access (PEP 562) to keep package import cheap.
+_LAZY_IMPORTS = {
+    "get_current_span": _CONTEXT_MODULE,
+    "push_span": _CONTEXT_MODULE,
+    "pop_span": _CONTEXT_MODULE,
+    "span_scope": _CONTEXT_MODULE,
+    "format_traceparent": _PROPAGATORS_MODULE,
+    "inject_traceparent": _PROPAGATORS_MODULE,
+    "parse_traceparent": _PROPAGATORS_MODULE,
+    "extract_traceparent": _PROPAGATORS_MODULE,
+    "format_tracestate": _PROPAGATORS_MODULE,
+    "parse_tracestate": _PROPAGATORS_MODULE,
+    "inject_tracestate": _PROPAGATORS_MODULE,
+    "extract_tracestate": _PROPAGATORS_MODULE,
+    "extract_trace_context": _PROPAGATORS_MODULE,
+    "inject": _PROPAGATORS_MODULE,
+    "extract": _PROPAGATORS_MODULE,
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,6 +10,13 @@ from opentelemetry import context as context_api
 if TYPE_CHECKING:
     from traccia.tracer.span import Span
 
+# Traccia wrapper for the span most recently pushed, stored in the same OTel
+# Context as the span itself. OTel's context remains the source of truth for
+# the active span; this only lets get_current_span() hand back the live
+# wrapper instead of building a new one. Keeping it in the OTel context means
+# a single attach/detach restores both, so push_span() still returns one token.
+_ACTIVE_SPAN_KEY = context_api.create_key("traccia-active-span")
+
 
 def get_current_span() -> Optional["Span"]:
     """
@@ -19,6 +26,11 @@ def get_current_span() -> Optional["Span"]:
     """
     otel_span = otel_get_current_span()
     if otel_span and otel_span.get_span_context().is_valid:
+        # Fast path: the active OTel span was pushed via push_span()
+        active = context_api.get_value(_ACTIVE_SPAN_KEY)
+        if active is not None and active._otel_span is otel_span:
+            return active
+        
         # Get tracer from span if available
         try:
             if hasattr(otel_span, '_traccia_tracer'):
@@ -49,19 +61,54 @@ def push_span(span: "Span") -> Token:
     """
     if hasattr(span, '_otel_span'):
         otel_span = span._otel_span
+        wrapper = span
     else:
         otel_span = span
+        wrapper = None
     
     ctx = set_span_in_context(otel_span)
-    token = context_api.attach(ctx)
-    return token
+    ctx = context_api.set_value(_ACTIVE_SPAN_KEY, wrapper, ctx)
+    return context_api.attach(ctx)
 
 
 def pop_span(token: Token) -> None:
     """
     Restore the previous span context using the provided token.
     
+    A token detached in a different Context than it was attached in (e.g.
+    across copy_context().run or a task handoff) is logged by OTel rather
+    than raised.
+    
     Args:
         token: Token returned by push_span()
     """
     context_api.detach(token)
+
+
+class _SpanScope:
+    """Keeps a span active for the duration of a ``with`` block."""
+    
+    __slots__ = ("span", "token")
+    
+    def __init__(self, span: "Span") -> None:
+        self.span = span
+        self.token: Optional[Token] = None
+    
+    def __enter__(self) -> "Span":
+        self.token = push_span(self.span)
+        return self.span
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        token, self.token = self.token, None
+        if token is not None:
+            pop_span(token)
+        return False
+
+
+def span_scope(span: "Span") -> _SpanScope:
+    """
+    Make an already-started span current within a ``with`` block.
+    
+    Unlike ``with span:``, the span is not ended on exit.
+    """
+    return _SpanScope(span)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Any
+import functools
+import re
+from typing import Dict, Mapping, Optional, Any, Tuple
 
 from opentelemetry.propagate import inject as otel_inject, extract as otel_extract
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -17,26 +19,34 @@ from traccia.utils.helpers import format_trace_id, format_span_id, parse_trace_i
 # Use OTel's W3C Trace Context propagator
 _propagator = TraceContextTextMapPropagator()
 
+# Canonical version-00 traceparent: parsed directly without an OTel round-trip.
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+_EMPTY_TRACESTATE = TraceState()
 
-def format_traceparent(context: SpanContext) -> str:
+
+def format_traceparent(context: SpanContext, *, strict: bool = False) -> str:
     """
     Format traceparent header value (W3C Trace Context standard).
     
-    Uses OpenTelemetry's propagator internally.
+    The version-00 header is built directly from the context fields. Pass
+    strict=True to route through OpenTelemetry's propagator instead (useful for
+    conformance testing).
     """
-    # Convert Traccia SpanContext to OTel SpanContext
-    otel_context = _traccia_to_otel_context(context)
-    
-    # Create a non-recording span with the context
-    span = NonRecordingSpan(otel_context)
-    ctx = set_span_in_context(span)
-    
-    # Create a carrier dict and inject
-    carrier: Dict[str, str] = {}
-    _propagator.inject(carrier, context=ctx)
-    
-    # Extract traceparent from carrier
-    return carrier.get("traceparent", "")
+    if strict:
+        return _format_traceparent_otel(context)
+    
+    trace_id = context.trace_id
+    span_id = context.span_id
+    if (
+        not trace_id
+        or not span_id
+        or trace_id == _INVALID_TRACE_ID
+        or span_id == _INVALID_SPAN_ID
+    ):
+        return ""
+    return f"00-{trace_id}-{span_id}-{context.trace_flags:02x}"
 
 
 def format_tracestate(state: Dict[str, str]) -> str:
@@ -68,176 +78,201 @@ def parse_tracestate(header_value: str) -> Dict[str, str]:
     """
     if not header_value:
         return {}
-    
-    result = {}
+    # Callers may mutate the result, so hand out a fresh dict per call.
+    return dict(_parse_tracestate_items(header_value))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_tracestate_items(header_value: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse tracestate into (key, value) pairs; cached since headers recur per upstream."""
+    items = []
     for item in header_value.split(","):
-        item = item.strip()
-        if not item or "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             continue
-        parts = item.split("=", 1)
-        if len(parts) == 2:
-            key = parts[0].strip().lower()
-            value = parts[1].strip()
-            if key and value:
-                result[key] = value
-    
-    return result
+        key = key.strip().lower()
+        value = value.strip()
+        if key and value:
+            items.append((key, value))
+    return tuple(items)
 
 
 def parse_traceparent(header_value: str) -> Optional[SpanContext]:
     """
     Parse a traceparent header into a SpanContext.
     
-    Uses OpenTelemetry's W3C Trace Context parser.
+    Canonical version-00 headers are matched with a precompiled regex; anything
+    else (future versions, surrounding whitespace) falls back to OpenTelemetry's
+    W3C Trace Context parser.
     """
     if not header_value:
         return None
     
-    # Use OTel to parse traceparent
-    carrier = {"traceparent": header_value}
-    ctx = _propagator.extract(carrier)
+    match = _TRACEPARENT_RE.match(header_value)
+    if match is None:
+        return _extract_with_otel({"traceparent": header_value})
     
-    # Get span context from OTel context
-    span = get_current_span(context=ctx)
-    if span:
-        otel_context = span.get_span_context()
-        if otel_context.is_valid:
-            return _otel_to_traccia_context(otel_context)
+    trace_id, span_id, flags = match.groups()
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
     
-    return None
+    return SpanContext(
+        trace_id=trace_id,
+        span_id=span_id,
+        trace_flags=int(flags, 16),
+    )
 
 
-def inject_traceparent(headers: Dict[str, str], context: SpanContext) -> None:
+def inject_traceparent(
+    headers: Dict[str, str], context: SpanContext, *, strict: bool = False
+) -> None:
     """
     Inject traceparent header into headers dict.
     
-    Uses OpenTelemetry's inject() function.
+    See format_traceparent() for the meaning of strict.
     """
-    # Convert Traccia context to OTel context
-    otel_context = _traccia_to_otel_context(context)
-    
-    # Create OTel context with span
-    span = NonRecordingSpan(otel_context)
-    ctx = set_span_in_context(span)
-    
-    # Inject using OTel
-    _propagator.inject(carrier=headers, context=ctx)
+    traceparent = format_traceparent(context, strict=strict)
+    if traceparent:
+        headers["traceparent"] = traceparent
 
 
 def inject_tracestate(headers: Dict[str, str], context: SpanContext) -> None:
     """
     Inject tracestate header if present on the context.
     
-    Uses OpenTelemetry's inject() function.
+    A W3C tracestate string is passed through as-is; a dict is formatted
+    with format_tracestate().
     """
-    if not context.trace_state:
+    trace_state = context.trace_state
+    if not trace_state:
         return
     
-    # Parse tracestate and create OTel TraceState
-    parsed = parse_tracestate(context.trace_state)
-    if parsed:
-        trace_state = TraceState([(k, v) for k, v in parsed.items()])
-        
-        # Convert Traccia context to OTel context with tracestate
-        otel_context = _traccia_to_otel_context(context)
-        # Update trace_state
-        otel_context = OTelSpanContext(
-            trace_id=otel_context.trace_id,
-            span_id=otel_context.span_id,
-            is_remote=otel_context.is_remote,
-            trace_flags=otel_context.trace_flags,
-            trace_state=trace_state,
-        )
-        
-        # Create span with context and inject
-        span = NonRecordingSpan(otel_context)
-        ctx = set_span_in_context(span)
-        _propagator.inject(carrier=headers, context=ctx)
+    if not isinstance(trace_state, str):
+        trace_state = format_tracestate(trace_state)
+        if not trace_state:
+            return
+    headers["tracestate"] = trace_state
 
 
-def extract_traceparent(headers: Dict[str, str]) -> Optional[SpanContext]:
+def extract_traceparent(headers: Mapping[str, str]) -> Optional[SpanContext]:
     """
     Extract traceparent header from headers and parse it.
-    
-    Uses OpenTelemetry's extract() function.
     """
-    # Use OTel to extract
-    ctx = _propagator.extract(carrier=headers)
-    
-    # Get span from context
-    span = get_current_span(context=ctx)
-    if span:
-        otel_context = span.get_span_context()
-        if otel_context.is_valid:
-            return _otel_to_traccia_context(otel_context)
-    
-    return None
+    return parse_traceparent(_get_header(headers, "traceparent"))
 
 
-def extract_tracestate(headers: Dict[str, str]) -> Optional[str]:
+def extract_tracestate(headers: Mapping[str, str]) -> Optional[str]:
     """
     Extract tracestate header value (case-insensitive).
     
     Returns the raw tracestate string.
     """
-    # Case-insensitive lookup
-    for key, value in headers.items():
-        if key.lower() == "tracestate":
-            return value
-    return None
+    return _get_header(headers, "tracestate")
 
 
-def extract_trace_context(headers: Dict[str, str]) -> Optional[SpanContext]:
+def extract_trace_context(headers: Mapping[str, str]) -> Optional[SpanContext]:
     """
     Extract both traceparent and tracestate and return a combined SpanContext.
+    """
+    context = extract_traceparent(headers)
+    if context is None:
+        return None
+    
+    # Carry the raw tracestate header through unchanged
+    tracestate_str = extract_tracestate(headers)
+    if tracestate_str:
+        context = SpanContext(
+            trace_id=context.trace_id,
+            span_id=context.span_id,
+            trace_flags=context.trace_flags,
+            trace_state=tracestate_str,
+        )
+    return context
+
+
+# Helper functions for context conversion
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """
+    Case-insensitive header lookup for a lowercase header name.
     
-    Uses OpenTelemetry's extract() function.
+    Tries the common spellings with direct dict lookups before falling back
+    to a full scan of the headers.
     """
-    # Use OTel to extract both
-    ctx = _propagator.extract(carrier=headers)
+    for key in (name, name.capitalize(), name.upper()):
+        value = headers.get(key)
+        if value is not None:
+            return value
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _format_traceparent_otel(context: SpanContext) -> str:
+    """Format traceparent via OTel's propagator (strict/conformance path)."""
+    # Convert Traccia SpanContext to OTel SpanContext
+    otel_context = _traccia_to_otel_context(context)
+    
+    # Create a non-recording span with the context
+    span = NonRecordingSpan(otel_context)
+    ctx = set_span_in_context(span)
     
-    # Get span from context
+    # Create a carrier dict and inject
+    carrier: Dict[str, str] = {}
+    _propagator.inject(carrier, context=ctx)
+    
+    # Extract traceparent from carrier
+    return carrier.get("traceparent", "")
+
+
+def _extract_with_otel(carrier: Dict[str, str]) -> Optional[SpanContext]:
+    """Parse a carrier with OTel's propagator (slow path for non-canonical headers)."""
+    ctx = _propagator.extract(carrier)
     span = get_current_span(context=ctx)
     if span:
         otel_context = span.get_span_context()
         if otel_context.is_valid:
-            # Extract tracestate separately
-            tracestate_str = extract_tracestate(headers)
-            return _otel_to_traccia_context(otel_context, tracestate_str)
-    
+            return _otel_to_traccia_context(otel_context)
     return None
 
 
-# Helper functions for context conversion
-
 def _traccia_to_otel_context(traccia_context: SpanContext) -> OTelSpanContext:
     """Convert Traccia SpanContext to OTel SpanContext."""
-    trace_id = parse_trace_id(traccia_context.trace_id)
-    span_id = parse_span_id(traccia_context.span_id)
-    trace_flags = TraceFlags(traccia_context.trace_flags)
-    
-    # Parse trace_state
-    trace_state = TraceState()
-    if traccia_context.trace_state:
-        parsed = parse_tracestate(traccia_context.trace_state)
-        if parsed:
-            items = [(k, v) for k, v in parsed.items()]
-            trace_state = TraceState(items)
-    
+    return _build_otel_context(
+        traccia_context.trace_id,
+        traccia_context.span_id,
+        traccia_context.trace_flags,
+        traccia_context.trace_state,
+    )
+
+
+def _build_otel_context(
+    trace_id: str, span_id: str, trace_flags: int, trace_state: Optional[str]
+) -> OTelSpanContext:
+    """Build an OTel SpanContext from Traccia's string fields."""
     return OTelSpanContext(
-        trace_id=trace_id,
-        span_id=span_id,
+        trace_id=parse_trace_id(trace_id),
+        span_id=parse_span_id(span_id),
         is_remote=False,
-        trace_flags=trace_flags,
-        trace_state=trace_state,
+        trace_flags=TraceFlags(trace_flags),
+        trace_state=_otel_trace_state(trace_state) if trace_state else _EMPTY_TRACESTATE,
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _otel_trace_state(trace_state: str) -> TraceState:
+    """Build an OTel TraceState; cached since tracestate headers recur per upstream."""
+    # TraceState takes the cached (key, value) pairs as-is
+    items = _parse_tracestate_items(trace_state)
+    return TraceState(items) if items else _EMPTY_TRACESTATE
+
+
 def _otel_to_traccia_context(otel_context: OTelSpanContext, tracestate_str: Optional[str] = None) -> SpanContext:
     """Convert OTel SpanContext to Traccia SpanContext."""
     trace_id = format_trace_id(otel_context.trace_id)
     span_id = format_span_id(otel_context.span_id)
-    trace_flags = 1 if otel_context.trace_flags.sampled else 0
+    trace_flags = int(otel_context.trace_flags)
     
     # Format trace_state
     trace_state = None
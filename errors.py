@@ -6,6 +6,10 @@ from __future__ import annotations
 class TracciaError(Exception):
     """Base exception for all Traccia SDK errors."""
     
+    # Slots keep BaseException from allocating a per-instance __dict__.
+    # Subclasses declare empty __slots__ to preserve this.
+    __slots__ = ("message", "details")
+    
     def __init__(self, message: str, details: dict = None):
         super().__init__(message)
         self.message = message
@@ -16,33 +20,37 @@ class TracciaError(Exception):
             details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
             return f"{self.message} ({details_str})"
         return self.message
+    
+    def __reduce__(self):
+        # Slot values aren't part of BaseException's pickled state
+        return (self.__class__, (self.message, self.details))
 
 
 class ConfigError(TracciaError):
     """Raised when configuration is invalid or conflicting."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(TracciaError):
     """Raised when validation fails."""
-    pass
+    __slots__ = ()
 
 
 class ExportError(TracciaError):
     """Raised when span export fails."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(TracciaError):
     """Raised when rate limit is exceeded (in strict mode)."""
-    pass
+    __slots__ = ()
 
 
 class InitializationError(TracciaError):
     """Raised when SDK initialization fails."""
-    pass
+    __slots__ = ()
 
 
 class InstrumentationError(TracciaError):
     """Raised when instrumentation/patching fails."""
-    pass
+    __slots__ = ()
@@ -1,8 +1,37 @@
 """Exporters for delivering spans to backends."""
 
-from traccia.exporter.http_exporter import HttpExporter
-from traccia.exporter.console_exporter import ConsoleExporter
-from traccia.exporter.file_exporter import FileExporter
-from traccia.exporter.otlp_exporter import OTLPExporter
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from traccia.exporter.http_exporter import HttpExporter
+    from traccia.exporter.console_exporter import ConsoleExporter
+    from traccia.exporter.file_exporter import FileExporter
+    from traccia.exporter.otlp_exporter import OTLPExporter
 
 __all__ = ["HttpExporter", "ConsoleExporter", "FileExporter", "OTLPExporter"]
+
+# Exporters are imported on first access so that e.g. using ConsoleExporter
+# doesn't pull in the OTLP/protobuf stack.
+_LAZY_IMPORTS = {
+    "HttpExporter": "traccia.exporter.http_exporter",
+    "ConsoleExporter": "traccia.exporter.console_exporter",
+    "FileExporter": "traccia.exporter.file_exporter",
+    "OTLPExporter": "traccia.exporter.otlp_exporter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
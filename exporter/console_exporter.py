@@ -15,15 +15,22 @@ class ConsoleExporter:
         self.stream = stream or sys.stdout
 
     def export(self, spans: Iterable[Span]) -> bool:
+        lines = []
         for span in spans:
             line = (
                 f"[span] name={span.name} trace_id={span.context.trace_id} "
                 f"span_id={span.context.span_id} status={span.status.name} "
                 f"duration_ns={span.duration_ns}"
             )
-            if span.attributes:
-                line += f" attrs={span.attributes}"
-            print(line, file=self.stream)
+            attrs = span.attributes
+            if attrs:
+                line = f"{line} attrs={attrs}"
+            lines.append(line)
+        if lines:
+            # One write per batch instead of one print() per span
+            lines.append("")
+            self.stream.write("\n".join(lines))
+            self.stream.flush()
         return True
 
     def shutdown(self) -> None:
@@ -8,18 +8,6 @@ from traccia.tracer.span import SpanStatus
 _patched = False
 
 
-def _safe_get(obj, path: str, default=None):
-    cur = obj
-    for part in path.split("."):
-        if cur is None:
-            return default
-        if isinstance(cur, dict):
-            cur = cur.get(part)
-        else:
-            cur = getattr(cur, part, None)
-    return cur if cur is not None else default
-
-
 def patch_anthropic() -> bool:
     """Patch Anthropic messages.create; returns True if patched, False otherwise."""
     global _patched
@@ -47,7 +35,10 @@ def patch_anthropic() -> bool:
 
     def wrapped_create(self, *args, **kwargs):
         tracer = _get_tracer("anthropic")
-        model = kwargs.get("model") or _safe_get(args, "0.model", None)
+        model = kwargs.get("model")
+        if not model and args:
+            first = args[0]
+            model = first.get("model") if isinstance(first, dict) else getattr(first, "model", None)
         attributes: Dict[str, Any] = {"llm.vendor": "anthropic"}
         if model:
             attributes["llm.model"] = model
@@ -57,20 +48,24 @@ def patch_anthropic() -> bool:
                 usage = getattr(resp, "usage", None) or resp.get("usage") if isinstance(resp, dict) else None
                 if usage:
                     span.set_attribute("llm.usage.source", "provider_usage")
-                    for k in ("input_tokens", "output_tokens"):
-                        if k in usage:
-                            span.set_attribute(f"llm.usage.{k}", usage[k])
+                    input_tokens = usage.get("input_tokens")
+                    output_tokens = usage.get("output_tokens")
                     # Provide OpenAI-style aliases so downstream processors (cost, etc.)
                     # can treat Anthropic uniformly.
-                    if "input_tokens" in usage and "llm.usage.prompt_tokens" not in span.attributes:
-                        span.set_attribute("llm.usage.prompt_tokens", usage["input_tokens"])
-                    if "input_tokens" in usage:
+                    if input_tokens is not None:
+                        span.set_attribute("llm.usage.input_tokens", input_tokens)
+                        if "llm.usage.prompt_tokens" not in span.attributes:
+                            span.set_attribute("llm.usage.prompt_tokens", input_tokens)
                         span.set_attribute("llm.usage.prompt_source", "provider_usage")
-                    if "output_tokens" in usage and "llm.usage.completion_tokens" not in span.attributes:
-                        span.set_attribute("llm.usage.completion_tokens", usage["output_tokens"])
-                    if "output_tokens" in usage:
+                    if output_tokens is not None:
+                        span.set_attribute("llm.usage.output_tokens", output_tokens)
+                        if "llm.usage.completion_tokens" not in span.attributes:
+                            span.set_attribute("llm.usage.completion_tokens", output_tokens)
                         span.set_attribute("llm.usage.completion_source", "provider_usage")
-                stop_reason = _safe_get(resp, "stop_reason") or _safe_get(resp, "stop_reason", None)
+                if isinstance(resp, dict):
+                    stop_reason = resp.get("stop_reason")
+                else:
+                    stop_reason = getattr(resp, "stop_reason", None)
                 if stop_reason:
                     span.set_attribute("llm.stop_reason", stop_reason)
                 return resp
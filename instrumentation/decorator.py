@@ -4,23 +4,66 @@ from __future__ import annotations
 
 import functools
 import inspect
+import json
 import traceback
+from contextvars import ContextVar
 from typing import Any, Callable, Dict, Iterable, Optional
+
+from opentelemetry.trace import get_current_span as otel_get_current_span
+
+from traccia import runtime_config
 from traccia.tracer.span import SpanStatus
 
+# Number of @observe spans open in the current context (see max_span_depth)
+_observe_depth: ContextVar[int] = ContextVar("traccia_observe_depth", default=0)
+
+
+def _format_stack_trace(exc: BaseException) -> str:
+    """Format at most the first few frames of exc's traceback, truncated to 2000 chars."""
+    # limit stops traceback from walking (and reading source for) deep stacks
+    lines = traceback.format_exception(type(exc), exc, exc.__traceback__, limit=10)
+    return "".join(lines)[:2000]
+
+
+def _in_unsampled_trace() -> bool:
+    """
+    Return True if the active span belongs to a trace that was sampled out.
+    
+    Children of an unsampled span are never recorded (parent-based sampling),
+    so observe() can call straight through without building a span.
+    """
+    span_context = otel_get_current_span().get_span_context()
+    return span_context.is_valid and not span_context.trace_flags.sampled
+
+
+# OTel attribute primitives; exact-type lookups here avoid isinstance() MRO walks
+_PRIMITIVE_TYPES = frozenset({bool, str, bytes, int, float, type(None)})
+_PRIMITIVE_TUPLE = (bool, str, bytes, int, float, type(None))
 
-def _capture_args(bound_args: inspect.BoundArguments, skip: Iterable[str]) -> Dict[str, Any]:
-    """Capture function arguments, converting complex types to OTel-compatible types."""
-    captured = {}
-    for name, value in bound_args.arguments.items():
-        if name in skip:
-            continue
-        # Skip 'self' - it's an object, not a valid OTel attribute
-        if name == "self":
-            continue
-        # Convert value to OTel-compatible type
-        captured[name] = _convert_to_otel_type(value)
-    return captured
+
+def _is_primitive(value: Any) -> bool:
+    return type(value) in _PRIMITIVE_TYPES or isinstance(value, _PRIMITIVE_TUPLE)
+
+
+def _convert_sequence(value: Any) -> Any:
+    converted = []
+    for item in value:
+        if _is_primitive(item):
+            converted.append(item)
+        else:
+            # Convert complex types to string representation
+            converted.append(str(item)[:1000])  # Truncate long strings
+    return converted[:100]  # Limit sequence length
+
+
+def _convert_dict(value: Any) -> Any:
+    try:
+        return json.dumps(value, default=str)[:1000]  # Truncate
+    except Exception:
+        return str(value)[:1000]
+
+
+_CONVERTERS = {list: _convert_sequence, tuple: _convert_sequence, dict: _convert_dict}
 
 
 def _convert_to_otel_type(value: Any) -> Any:
@@ -29,32 +72,29 @@ def _convert_to_otel_type(value: Any) -> Any:
     
     OTel attributes must be: bool, str, bytes, int, float, or sequences of those.
     """
+    value_type = type(value)
     # Primitive types are fine
-    if isinstance(value, (bool, str, bytes, int, float)) or value is None:
+    if value_type in _PRIMITIVE_TYPES:
         return value
     
-    # For sequences, convert each element
-    if isinstance(value, (list, tuple)):
-        converted = []
-        for item in value:
-            if isinstance(item, (bool, str, bytes, int, float)) or item is None:
-                converted.append(item)
-            else:
-                # Convert complex types to string representation
-                converted.append(str(item)[:1000])  # Truncate long strings
-        return converted[:100]  # Limit sequence length
-    
-    # For dicts and other complex types, convert to JSON string
-    if isinstance(value, dict):
-        try:
-            import json
-            json_str = json.dumps(value, default=str)[:1000]  # Truncate
-            return json_str
-        except Exception:
-            return str(value)[:1000]
-    
-    # For other types, convert to string
-    return str(value)[:1000]  # Truncate long strings
+    converter = _CONVERTERS.get(value_type)
+    if converter is None:
+        # Subclasses of the handled types fall back to isinstance checks
+        if isinstance(value, _PRIMITIVE_TUPLE):
+            return value
+        if isinstance(value, (list, tuple)):
+            converter = _convert_sequence
+        elif isinstance(value, dict):
+            converter = _convert_dict
+        else:
+            # For other types, convert to string
+            return str(value)[:1000]  # Truncate long strings
+    return converter(value)
+
+
+_LLM_MARKER_KEYS = ("llm.model", "llm.vendor", "model")
+_TOOL_MARKER_KEYS = ("tool.name", "tool", "http.url")
+_TYPE_MARKER_KEYS = frozenset(_LLM_MARKER_KEYS + _TOOL_MARKER_KEYS)
 
 
 def _infer_type_from_attributes(attributes: Dict[str, Any]) -> Optional[str]:
@@ -67,17 +107,17 @@ def _infer_type_from_attributes(attributes: Dict[str, Any]) -> Optional[str]:
         - None otherwise (will use default "span")
     """
     # Check for LLM indicators
-    if any(key in attributes for key in ["llm.model", "llm.vendor", "model"]):
+    if any(key in attributes for key in _LLM_MARKER_KEYS):
         return "llm"
     
     # Check for tool indicators
-    if any(key in attributes for key in ["tool.name", "tool", "http.url"]):
+    if any(key in attributes for key in _TOOL_MARKER_KEYS):
         return "tool"
     
     return None
 
 
-def _extract_llm_attributes(span_attrs: Dict[str, Any], bound_args: inspect.BoundArguments) -> None:
+def _extract_llm_attributes(span_attrs: Dict[str, Any], args_dict: Dict[str, Any]) -> None:
     """
     Extract LLM-related attributes from function arguments.
     
@@ -86,38 +126,38 @@ def _extract_llm_attributes(span_attrs: Dict[str, Any], bound_args: inspect.Boun
     
     Args:
         span_attrs: Dictionary to add extracted attributes to
-        bound_args: Bound arguments from the function call
+        args_dict: Bound arguments from the function call, by parameter name
     """
     try:
-        args_dict = dict(bound_args.arguments)
+        # One lookup per parameter; None means "not passed" (or explicitly None)
+        get = args_dict.get
         
         # Extract model
-        if "model" in args_dict and "llm.model" not in span_attrs:
-            span_attrs["llm.model"] = str(args_dict["model"])
+        model = get("model")
+        if model is not None and "llm.model" not in span_attrs:
+            span_attrs["llm.model"] = str(model)
         
         # Extract temperature
-        if "temperature" in args_dict and "llm.temperature" not in span_attrs:
-            temp = args_dict["temperature"]
-            if isinstance(temp, (int, float)):
-                span_attrs["llm.temperature"] = temp
+        temp = get("temperature")
+        if isinstance(temp, (int, float)) and "llm.temperature" not in span_attrs:
+            span_attrs["llm.temperature"] = temp
         
         # Extract max_tokens
-        if "max_tokens" in args_dict and "llm.max_tokens" not in span_attrs:
-            max_tok = args_dict["max_tokens"]
-            if isinstance(max_tok, int):
-                span_attrs["llm.max_tokens"] = max_tok
+        max_tok = get("max_tokens")
+        if isinstance(max_tok, int) and "llm.max_tokens" not in span_attrs:
+            span_attrs["llm.max_tokens"] = max_tok
         
         # Extract messages/prompt
-        if "messages" in args_dict and "llm.prompt" not in span_attrs:
-            messages = args_dict["messages"]
-            if isinstance(messages, (list, str)):
-                # Convert messages to string representation
-                prompt_str = _convert_to_otel_type(messages)
-                span_attrs["llm.prompt"] = prompt_str
-        elif "prompt" in args_dict and "llm.prompt" not in span_attrs:
-            prompt = args_dict["prompt"]
-            if isinstance(prompt, str):
-                span_attrs["llm.prompt"] = prompt[:1000]
+        if "llm.prompt" not in span_attrs:
+            messages = get("messages")
+            if messages is not None:
+                if isinstance(messages, (list, str)):
+                    # Convert messages to string representation
+                    span_attrs["llm.prompt"] = _convert_to_otel_type(messages)
+            else:
+                prompt = get("prompt")
+                if isinstance(prompt, str):
+                    span_attrs["llm.prompt"] = prompt[:1000]
     
     except Exception:
         # Fail silently - don't interrupt span creation if extraction fails
@@ -143,47 +183,103 @@ def observe(
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         span_name = name or func.__name__
-        arg_names = func.__code__.co_varnames
-        skip_args_set = set(skip_args or [])
+        # 'self' is an object, not a valid OTel attribute, so it is never captured
+        skip_args_set = frozenset(skip_args or ()) | {"self"}
         tags_list = [str(tag) for tag in tags] if tags is not None else []
+        base_attrs = dict(attributes or {})
+        if tags_list:
+            base_attrs["span.tags"] = tags_list
+        sig = inspect.signature(func)
+        capturable = set(sig.parameters) - skip_args_set
+
+        # Infer the type from the static attributes now. Captured arguments
+        # are keyed by parameter name, so only a parameter named like a marker
+        # key (e.g. "model") can change the result at call time.
+        static_type = as_type
+        infer_per_call = False
+        if as_type == "span":
+            static_type = _infer_type_from_attributes(base_attrs) or as_type
+            infer_per_call = static_type != "llm" and not capturable.isdisjoint(_TYPE_MARKER_KEYS)
+
+        # Binding is only needed to capture arguments or to extract LLM
+        # attributes; otherwise the wrappers skip it entirely.
+        needs_binding = bool(capturable) or static_type == "llm"
+
+        # For plain (a, b, c) signatures, a call passing every argument
+        # positionally maps straight onto the parameter names.
+        param_names = tuple(sig.parameters)
+        zip_bindable = all(
+            param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            for param in sig.parameters.values()
+        )
+
+        def bind_arguments(args, kwargs) -> Dict[str, Any]:
+            if zip_bindable and not kwargs and len(args) == len(param_names):
+                return dict(zip(param_names, args))
+            bound = sig.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.arguments
 
         is_coro = inspect.iscoroutinefunction(func)
 
+        # Reuse the tracer across calls; re-resolve only if the global
+        # provider is swapped (init() or set_tracer_provider()).
+        tracer_name = func.__module__ or "default"
+        cached_provider = None
+        cached_tracer = None
+
+        def get_tracer():
+            nonlocal cached_provider, cached_tracer
+            provider = _get_tracer_provider()
+            if provider is not cached_provider:
+                cached_tracer = provider.get_tracer(tracer_name)
+                cached_provider = provider
+            return cached_tracer
+
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            tracer = _get_tracer(func.__module__ or "default")
-            bound = inspect.signature(func).bind_partial(*args, **kwargs)
-            bound.apply_defaults()
-
-            span_attrs = dict(attributes or {})
-            if tags_list:
-                span_attrs["span.tags"] = tags_list
-            
-            # Capture function arguments first
-            span_attrs.update(_capture_args(bound, skip_args_set))
+            # Past max_span_depth (or in an unsampled trace) just call through
+            depth = _observe_depth.get()
+            max_depth = runtime_config.get_max_span_depth()
+            if (max_depth is not None and depth >= max_depth) or _in_unsampled_trace():
+                return func(*args, **kwargs)
+            tracer = get_tracer()
+            span_attrs = base_attrs.copy()
             
-            # Infer type from attributes if not explicitly set (or if set to default "span")
-            inferred_type = as_type
-            if as_type == "span":
-                # Try to infer from attributes
-                detected_type = _infer_type_from_attributes(span_attrs)
-                if detected_type:
-                    inferred_type = detected_type
+            inferred_type = static_type
+            if needs_binding:
+                arguments = bind_arguments(args, kwargs)
+                
+                # Capture function arguments first
+                for arg, value in arguments.items():
+                    if arg not in skip_args_set:
+                        span_attrs[arg] = _convert_to_otel_type(value)
+                
+                # Re-infer only if a captured argument can change the type
+                if infer_per_call:
+                    detected_type = _infer_type_from_attributes(span_attrs)
+                    if detected_type:
+                        inferred_type = detected_type
+                
+                # Extract LLM attributes if this is an LLM call
+                if inferred_type == "llm":
+                    _extract_llm_attributes(span_attrs, arguments)
             
             # Set span type
             span_attrs["span.type"] = inferred_type
-            
-            # Extract LLM attributes if this is an LLM call
-            if inferred_type == "llm":
-                _extract_llm_attributes(span_attrs, bound)
 
             with tracer.start_as_current_span(span_name, attributes=span_attrs) as span:
+                depth_token = _observe_depth.set(depth + 1)
                 try:
                     result = func(*args, **kwargs)
                     if not skip_result:
-                        # Convert result to OTel-compatible type
-                        otel_result = _convert_to_otel_type(result)
-                        span.set_attribute("result", otel_result)
+                        if runtime_config.get_trace_result():
+                            # Convert result to OTel-compatible type
+                            otel_result = _convert_to_otel_type(result)
+                            span.set_attribute("result", otel_result)
+                        else:
+                            # trace_result=False skips serializing the value
+                            span.set_attribute("result.type", type(result).__name__)
                     return result
                 except Exception as exc:
                     # Record detailed error information
@@ -195,46 +291,56 @@ def observe(
                     span.set_attribute("error.message", str(exc))
                     
                     # Add truncated stack trace
-                    tb = traceback.format_exc()
-                    span.set_attribute("error.stack_trace", tb[:2000])  # Truncate to 2000 chars
+                    span.set_attribute("error.stack_trace", _format_stack_trace(exc))
                     
                     raise
+                finally:
+                    _observe_depth.reset(depth_token)
 
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            tracer = _get_tracer(func.__module__ or "default")
-            bound = inspect.signature(func).bind_partial(*args, **kwargs)
-            bound.apply_defaults()
-
-            span_attrs = dict(attributes or {})
-            if tags_list:
-                span_attrs["span.tags"] = tags_list
-            
-            # Capture function arguments first
-            span_attrs.update(_capture_args(bound, skip_args_set))
+            # Past max_span_depth (or in an unsampled trace) just call through
+            depth = _observe_depth.get()
+            max_depth = runtime_config.get_max_span_depth()
+            if (max_depth is not None and depth >= max_depth) or _in_unsampled_trace():
+                return await func(*args, **kwargs)
+            tracer = get_tracer()
+            span_attrs = base_attrs.copy()
             
-            # Infer type from attributes if not explicitly set (or if set to default "span")
-            inferred_type = as_type
-            if as_type == "span":
-                # Try to infer from attributes
-                detected_type = _infer_type_from_attributes(span_attrs)
-                if detected_type:
-                    inferred_type = detected_type
+            inferred_type = static_type
+            if needs_binding:
+                arguments = bind_arguments(args, kwargs)
+                
+                # Capture function arguments first
+                for arg, value in arguments.items():
+                    if arg not in skip_args_set:
+                        span_attrs[arg] = _convert_to_otel_type(value)
+                
+                # Re-infer only if a captured argument can change the type
+                if infer_per_call:
+                    detected_type = _infer_type_from_attributes(span_attrs)
+                    if detected_type:
+                        inferred_type = detected_type
+                
+                # Extract LLM attributes if this is an LLM call
+                if inferred_type == "llm":
+                    _extract_llm_attributes(span_attrs, arguments)
             
             # Set span type
             span_attrs["span.type"] = inferred_type
-            
-            # Extract LLM attributes if this is an LLM call
-            if inferred_type == "llm":
-                _extract_llm_attributes(span_attrs, bound)
 
             async with tracer.start_as_current_span(span_name, attributes=span_attrs) as span:
+                depth_token = _observe_depth.set(depth + 1)
                 try:
                     result = await func(*args, **kwargs)
                     if not skip_result:
-                        # Convert result to OTel-compatible type
-                        otel_result = _convert_to_otel_type(result)
-                        span.set_attribute("result", otel_result)
+                        if runtime_config.get_trace_result():
+                            # Convert result to OTel-compatible type
+                            otel_result = _convert_to_otel_type(result)
+                            span.set_attribute("result", otel_result)
+                        else:
+                            # trace_result=False skips serializing the value
+                            span.set_attribute("result.type", type(result).__name__)
                     return result
                 except Exception as exc:
                     # Record detailed error information
@@ -246,18 +352,26 @@ def observe(
                     span.set_attribute("error.message", str(exc))
                     
                     # Add truncated stack trace
-                    tb = traceback.format_exc()
-                    span.set_attribute("error.stack_trace", tb[:2000])  # Truncate to 2000 chars
+                    span.set_attribute("error.stack_trace", _format_stack_trace(exc))
                     
                     raise
+                finally:
+                    _observe_depth.reset(depth_token)
 
         return async_wrapper if is_coro else sync_wrapper
 
     return decorator
 
 
-def _get_tracer(name: str):
-    import traccia
+_traccia_module = None
+
+
+def _get_tracer_provider():
+    # traccia imports this module, so it can only be bound after import
+    global _traccia_module
+    if _traccia_module is None:
+        import traccia
 
-    return traccia.get_tracer(name)
+        _traccia_module = traccia
+    return _traccia_module.get_tracer_provider()
 
@@ -22,12 +22,11 @@ def install_http_middleware(app: Any, *, tracer_name: str = "agents-fastapi") ->
         # Lazy import to avoid circular import when traccia initializes.
         from traccia import get_tracer
         tracer = get_tracer(tracer_name)
-        headers = dict(request.headers)
         attrs = {
             "http.method": request.method,
             "http.target": request.url.path,
         }
-        async with start_server_span(tracer, "http.request", headers, attributes=attrs) as span:
+        async with start_server_span(tracer, "http.request", request.headers, attributes=attrs) as span:
             response = await call_next(request)
             try:
                 span.set_attribute("http.status_code", response.status_code)
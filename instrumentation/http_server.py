@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Mapping, Optional
 
 from traccia.context import extract_trace_context
 from traccia.tracer.tracer import Tracer
 from traccia.tracer.span_context import SpanContext
 
 
-def extract_parent_context(headers: Dict[str, str]) -> Optional[SpanContext]:
-    """Parse traceparent/tracestate from headers and return SpanContext if valid."""
+def extract_parent_context(headers: Mapping[str, str]) -> Optional[SpanContext]:
+    """
+    Parse traceparent/tracestate from headers and return SpanContext if valid.
+    
+    Any mapping works, including case-insensitive header objects, so callers
+    don't need to copy request headers into a dict first.
+    """
     return extract_trace_context(headers)
 
 
-def start_server_span(tracer: Tracer, name: str, headers: Dict[str, str], attributes=None):
+def start_server_span(tracer: Tracer, name: str, headers: Mapping[str, str], attributes=None):
     """
     Convenience helper to start a server span with extracted parent context.
 
@@ -2,25 +2,77 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Callable
+import json
+from typing import Any, Dict, Iterable, Optional, Callable
 from traccia.tracer.span import SpanStatus
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+# Both branches emit compact, unescaped UTF-8 JSON so attribute values (and
+# where they get truncated) don't depend on whether orjson is installed
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+_JSON_ITEM_SEPARATOR = ","
+
 _patched = False
 _responses_patched = False
 
 
-def _safe_get(obj, path: str, default=None):
+# Lookup paths for _safe_get: str parts are keys/attributes, int parts index sequences
+_ARG0_MODEL_PATH = (0, "model")
+_MODEL_PATH = ("model",)
+_USAGE_PATH = ("usage",)
+_STATUS_PATH = ("status",)
+_OUTPUT_PATH = ("output",)
+_FINISH_REASON_PATH = ("choices", 0, "finish_reason")
+_COMPLETION_PATH = ("choices", 0, "message", "content")
+
+
+def _safe_get(obj, path: tuple, default=None):
     cur = obj
-    for part in path.split("."):
+    for part in path:
         if cur is None:
             return default
-        if isinstance(cur, dict):
+        if isinstance(part, int):
+            try:
+                cur = cur[part]
+            except (IndexError, KeyError, TypeError):
+                return default
+        elif isinstance(cur, dict):
             cur = cur.get(part)
         else:
             cur = getattr(cur, part, None)
     return cur if cur is not None else default
 
 
+def _json_dumps_truncated(items: Iterable[Any], limit: int = 1000) -> str:
+    """
+    Equivalent to dumping list(items) as JSON and keeping the first limit chars.
+    
+    Items are serialized one at a time (with orjson when installed) and
+    serialization stops once the output reaches limit characters.
+    """
+    parts = ["["]
+    size = 1
+    for index, item in enumerate(items):
+        if size >= limit:
+            break
+        chunk = _json_dumps(item) if index == 0 else _JSON_ITEM_SEPARATOR + _json_dumps(item)
+        parts.append(chunk)
+        size += len(chunk)
+    else:
+        parts.append("]")
+    return "".join(parts)[:limit]
+
+
 def patch_openai() -> bool:
     """Patch OpenAI chat completions for both legacy and new client APIs."""
     global _patched
@@ -31,42 +83,32 @@ def patch_openai() -> bool:
     except Exception:
         return False
 
-    def _extract_messages(kwargs, args):
+    def _extract_messages_and_prompt(kwargs, args):
+        """Build the slim message list and the prompt text in a single pass."""
         messages = kwargs.get("messages")
         # For new client, first arg after self is messages
         if messages is None and len(args) >= 2:
             messages = args[1]
         if not messages or not isinstance(messages, (list, tuple)):
-            return None
+            return None, None
         # Keep only JSON-friendly, small fields to avoid huge/sensitive payloads.
         slim = []
-        for m in list(messages)[:50]:
+        parts = []
+        for m in messages[:50]:
             if not isinstance(m, dict):
                 continue
             role = m.get("role")
             name = m.get("name")
             content = m.get("content")
-            if isinstance(content, (list, dict)):
-                content = str(content)
-            elif content is not None and not isinstance(content, str):
+            if content is not None and not isinstance(content, str):
                 content = str(content)
             item = {"role": role, "content": content}
             if name:
                 item["name"] = name
             slim.append(item)
-        return slim or None
-
-    def _extract_prompt_text(messages_slim) -> Optional[str]:
-        if not messages_slim:
-            return None
-        parts = []
-        for m in messages_slim:
-            role = m.get("role")
-            content = m.get("content")
-            if not content:
-                continue
-            parts.append(f"{role}: {content}" if role else str(content))
-        return "\n".join(parts) if parts else None
+            if content:
+                parts.append(f"{role}: {content}" if role else content)
+        return slim or None, "\n".join(parts) if parts else None
 
     def _extract_prompt(kwargs, args) -> Optional[str]:
         messages = kwargs.get("messages")
@@ -88,17 +130,17 @@ def patch_openai() -> bool:
 
         def wrapped_create(*args, **kwargs):
             tracer = _get_tracer("openai")
-            model = kwargs.get("model") or _safe_get(args, "0.model", None)
-            messages_slim = _extract_messages(kwargs, args)
-            prompt_text = _extract_prompt_text(messages_slim) or _extract_prompt(kwargs, args)
+            model = kwargs.get("model") or _safe_get(args, _ARG0_MODEL_PATH)
+            messages_slim, prompt_text = _extract_messages_and_prompt(kwargs, args)
+            if prompt_text is None:
+                prompt_text = _extract_prompt(kwargs, args)
             attributes: Dict[str, Any] = {"llm.vendor": "openai"}
             if model:
                 attributes["llm.model"] = model
             if messages_slim:
                 # Convert messages to JSON string for OTel compatibility
-                import json
                 try:
-                    attributes["llm.openai.messages"] = json.dumps(messages_slim)[:1000]
+                    attributes["llm.openai.messages"] = _json_dumps_truncated(messages_slim)
                 except Exception:
                     attributes["llm.openai.messages"] = str(messages_slim)[:1000]
             if prompt_text:
@@ -107,7 +149,7 @@ def patch_openai() -> bool:
                 try:
                     resp = create_fn(*args, **kwargs)
                     # capture model from response if not already set
-                    resp_model = getattr(resp, "model", None) or (_safe_get(resp, "model"))
+                    resp_model = getattr(resp, "model", None) or (_safe_get(resp, _MODEL_PATH))
                     if resp_model and "llm.model" not in span.attributes:
                         span.set_attribute("llm.model", resp_model)
                     usage = getattr(resp, "usage", None) or (resp.get("usage") if isinstance(resp, dict) else None)
@@ -121,10 +163,10 @@ def patch_openai() -> bool:
                             span.set_attribute("llm.usage.prompt_source", "provider_usage")
                         if "llm.usage.completion_tokens" in span.attributes:
                             span.set_attribute("llm.usage.completion_source", "provider_usage")
-                    finish_reason = _safe_get(resp, "choices.0.finish_reason")
+                    finish_reason = _safe_get(resp, _FINISH_REASON_PATH)
                     if finish_reason:
                         span.set_attribute("llm.finish_reason", finish_reason)
-                    completion = _safe_get(resp, "choices.0.message.content")
+                    completion = _safe_get(resp, _COMPLETION_PATH)
                     if completion:
                         span.set_attribute("llm.completion", completion)
                     return resp
@@ -227,7 +269,7 @@ def patch_openai_responses() -> bool:
 
     def _extract_responses_output(resp) -> Optional[str]:
         """Extract output text from Response object."""
-        output = getattr(resp, "output", None) or _safe_get(resp, "output")
+        output = getattr(resp, "output", None) or _safe_get(resp, _OUTPUT_PATH)
         if not output:
             return None
         
@@ -258,7 +300,7 @@ def patch_openai_responses() -> bool:
 
         async def wrapped_create(*args, **kwargs):
             tracer = _get_tracer("openai.responses")
-            model = kwargs.get("model") or _safe_get(args, "0.model", None)
+            model = kwargs.get("model") or _safe_get(args, _ARG0_MODEL_PATH)
             input_slim, prompt_text = _extract_responses_input(kwargs, args)
             
             attributes: Dict[str, Any] = {
@@ -268,9 +310,8 @@ def patch_openai_responses() -> bool:
             if model:
                 attributes["llm.model"] = model
             if input_slim:
-                import json
                 try:
-                    attributes["llm.openai.input"] = json.dumps(input_slim)[:1000]
+                    attributes["llm.openai.input"] = _json_dumps_truncated(input_slim)
                 except Exception:
                     attributes["llm.openai.input"] = str(input_slim)[:1000]
             if prompt_text:
@@ -281,12 +322,12 @@ def patch_openai_responses() -> bool:
                     resp = await create_fn(*args, **kwargs)
                     
                     # Extract response details
-                    resp_model = getattr(resp, "model", None) or _safe_get(resp, "model")
+                    resp_model = getattr(resp, "model", None) or _safe_get(resp, _MODEL_PATH)
                     if resp_model and "llm.model" not in span.attributes:
                         span.set_attribute("llm.model", str(resp_model))
                     
                     # Extract usage
-                    usage = getattr(resp, "usage", None) or _safe_get(resp, "usage")
+                    usage = getattr(resp, "usage", None) or _safe_get(resp, _USAGE_PATH)
                     if usage:
                         span.set_attribute("llm.usage.source", "provider_usage")
                         input_tokens = getattr(usage, "input_tokens", None) or (usage.get("input_tokens") if isinstance(usage, dict) else None)
@@ -310,7 +351,7 @@ def patch_openai_responses() -> bool:
                         span.set_attribute("llm.completion", completion[:2000])
                     
                     # Extract status
-                    status = getattr(resp, "status", None) or _safe_get(resp, "status")
+                    status = getattr(resp, "status", None) or _safe_get(resp, _STATUS_PATH)
                     if status:
                         span.set_attribute("llm.response.status", str(status))
                     
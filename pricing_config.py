@@ -9,9 +9,10 @@ prices and model versions frequently. The SDK therefore supports:
 
 from __future__ import annotations
 
+import functools
 import json
 import os
-from typing import Dict, Literal, Tuple
+from typing import Dict, Literal, Optional, Tuple
 
 from traccia.processors.cost_engine import DEFAULT_PRICING
 
@@ -27,6 +28,16 @@ def fetch_remote_pricing() -> Dict[str, Dict[str, float]]:
 PricingSource = Literal["default", "env", "override"]
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_env_pricing(env_override: str) -> Optional[Dict[str, Dict[str, float]]]:
+    """Decode the env pricing JSON; cached so periodic refreshes don't re-parse it."""
+    try:
+        env_pricing = json.loads(env_override)
+    except Exception:
+        return None
+    return env_pricing if isinstance(env_pricing, dict) else None
+
+
 def load_pricing_with_source(
     override: Dict[str, Dict[str, float]] | None = None,
 ) -> Tuple[Dict[str, Dict[str, float]], PricingSource]:
@@ -38,13 +49,10 @@ def load_pricing_with_source(
 
     env_override = os.getenv("AGENT_DASHBOARD_PRICING_JSON")
     if env_override:
-        try:
-            env_pricing = json.loads(env_override)
-            if isinstance(env_pricing, dict):
-                pricing.update(env_pricing)
-                source = "env"
-        except Exception:
-            pass
+        env_pricing = _parse_env_pricing(env_override)
+        if env_pricing is not None:
+            pricing.update(env_pricing)
+            source = "env"
     if override:
         pricing.update(override)
         source = "override"
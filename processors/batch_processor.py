@@ -5,13 +5,17 @@ from __future__ import annotations
 import threading
 import time
 from collections import deque
+from contextlib import nullcontext
 from typing import Deque, Iterable, List, Optional
 
-from traccia.processors.drop_policy import DEFAULT_DROP_POLICY, DropPolicy
+from traccia.processors.drop_policy import DEFAULT_DROP_POLICY, DropOldestPolicy, DropPolicy
 from traccia.processors.sampler import Sampler
 from traccia.tracer.provider import SpanProcessor
 from traccia.tracer.span import Span
 
+# Stands in for _lock in the drain when producers never take it
+_NO_LOCK = nullcontext()
+
 
 class BatchSpanProcessor(SpanProcessor):
     """
@@ -20,6 +24,13 @@ class BatchSpanProcessor(SpanProcessor):
     Note: This runs as an enrichment processor (before span.end()),
     but it queues spans and exports them after they end.
     When exporting, it extracts ReadableSpan from the OTel span.
+    
+    The tunables mirror OpenTelemetry's BatchSpanProcessor and its env vars:
+    max_queue_size (OTEL_BSP_MAX_QUEUE_SIZE), max_export_batch_size
+    (OTEL_BSP_MAX_EXPORT_BATCH_SIZE), schedule_delay_millis
+    (OTEL_BSP_SCHEDULE_DELAY) and export_timeout_millis (OTEL_BSP_EXPORT_TIMEOUT).
+    Through init() the first three come from TRACCIA_MAX_QUEUE_SIZE,
+    TRACCIA_MAX_EXPORT_BATCH_SIZE and TRACCIA_SCHEDULE_DELAY_MILLIS.
     """
     
     def __init__(
@@ -29,6 +40,7 @@ class BatchSpanProcessor(SpanProcessor):
         max_queue_size: int = 5000,
         max_export_batch_size: int = 512,
         schedule_delay_millis: int = 5000,
+        export_timeout_millis: int = 30000,
         drop_policy: Optional[DropPolicy] = None,
         sampler: Optional[Sampler] = None,
     ) -> None:
@@ -36,13 +48,21 @@ class BatchSpanProcessor(SpanProcessor):
         self.max_queue_size = max_queue_size
         self.max_export_batch_size = max_export_batch_size
         self.schedule_delay = schedule_delay_millis / 1000.0
+        # Upper bound on the final flush at shutdown; exporters own per-request timeouts
+        self.export_timeout = export_timeout_millis / 1000.0
         self.drop_policy = drop_policy or DEFAULT_DROP_POLICY
         self.sampler = sampler
 
-        self._queue: Deque[Span] = deque()
+        # deque(maxlen=...) evicts the oldest span on append, which is exactly
+        # DropOldestPolicy; append/popleft are atomic, so that policy needs no lock.
+        self._queue: Deque[Span] = deque(maxlen=max_queue_size)
+        self._lock_free = type(self.drop_policy) is DropOldestPolicy
         self._lock = threading.Lock()
+        # Serializes consumers (worker vs. force_flush); producers never take it
+        self._drain_lock = threading.Lock()
         self._event = threading.Event()
         self._shutdown = False
+        self._dropped_spans = 0
         self._worker = threading.Thread(target=self._worker_loop, daemon=True)
         self._worker.start()
 
@@ -64,13 +84,31 @@ class BatchSpanProcessor(SpanProcessor):
             return
 
         # Prevent double-queuing (span might be queued multiple times if on_end is called multiple times)
-        if hasattr(span, '_batch_queued') and span._batch_queued:
+        if getattr(span, "_batch_queued", False):
             return
 
-        with self._lock:
-            enqueued = self.drop_policy.handle(self._queue, span, self.max_queue_size)
-            if enqueued:
-                span._batch_queued = True  # Mark as queued
+        queue = self._queue
+        if self._lock_free:
+            if len(queue) >= self.max_queue_size:
+                # The append below evicts the oldest span
+                with self._lock:
+                    self._dropped_spans += 1
+            queue.append(span)
+            enqueued = True
+        else:
+            with self._lock:
+                queued_before = len(queue)
+                enqueued = self.drop_policy.handle(queue, span, self.max_queue_size)
+                # Either the new span was rejected or an older one was evicted for it
+                if not enqueued or len(queue) <= queued_before:
+                    self._dropped_spans += 1
+
+        if enqueued:
+            span._batch_queued = True  # Mark as queued
+            # Wake the worker early only once a full batch is waiting; smaller
+            # batches go out on the schedule_delay timer. Event.set() takes a
+            # lock, so skip it while the worker is already signalled.
+            if len(queue) >= self.max_export_batch_size and not self._event.is_set():
                 self._event.set()
 
     def force_flush(self, timeout: Optional[float] = None) -> None:
@@ -88,7 +126,16 @@ class BatchSpanProcessor(SpanProcessor):
         self._shutdown = True
         self._event.set()
         self._worker.join(timeout=self.schedule_delay * 2)
-        self.force_flush()
+        self.force_flush(timeout=self.export_timeout)
+
+    def get_stats(self) -> dict:
+        """Get queue statistics."""
+        with self._lock:
+            return {
+                "queued_spans": len(self._queue),
+                "max_queue_size": self.max_queue_size,
+                "dropped_spans": self._dropped_spans,
+            }
 
     # Internal
     def _worker_loop(self) -> None:
@@ -96,7 +143,9 @@ class BatchSpanProcessor(SpanProcessor):
         while not self._shutdown:
             self._event.wait(timeout=self.schedule_delay)
             self._event.clear()
-            self._flush_once()
+            # Keep going while full batches are waiting instead of sleeping again
+            while self._flush_once() and len(self._queue) >= self.max_export_batch_size:
+                pass
 
     def _flush_once(self) -> bool:
         """Flush one batch of spans."""
@@ -108,11 +157,16 @@ class BatchSpanProcessor(SpanProcessor):
 
     def _drain_queue(self, limit: int) -> List[Span]:
         """Drain spans from queue up to limit."""
-        items: List[Span] = []
-        with self._lock:
-            while self._queue and len(items) < limit:
-                items.append(self._queue.popleft())
-        return items
+        queue = self._queue
+        popleft = queue.popleft
+        # Lock-free producers only append (a full deque evicts on the left
+        # without shrinking), so the queue cannot get shorter than `count`
+        # behind the serialized consumer. Other drop policies may pop or
+        # remove queued spans under _lock, so the drain must hold it too.
+        producer_lock = _NO_LOCK if self._lock_free else self._lock
+        with self._drain_lock, producer_lock:
+            count = min(limit, len(queue))
+            return [popleft() for _ in range(count)]
 
     def _export(self, spans: Iterable[Span]) -> None:
         """
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Dict, Optional, Tuple
 
+from traccia.utils.helpers import PrefixIndex, build_prefix_index, match_longest_prefix
+
 DEFAULT_PRICING: Dict[str, Dict[str, float]] = {
     # prices per 1k tokens
     "gpt-4": {"prompt": 0.03, "completion": 0.06},
@@ -16,6 +18,35 @@ DEFAULT_PRICING: Dict[str, Dict[str, float]] = {
     #   - start_tracing(pricing_override={...})
 }
 
+# (matched key, prompt price per token, completion price per token)
+_ResolvedPrice = Tuple[str, float, float]
+
+# Per-table lookup state, keyed by id(): (table, size, prefix index, resolved).
+# The table itself is held so its id can't be reused while cached, and the
+# size check rebuilds the entry when models are added or removed. `resolved`
+# memoizes model name -> _ResolvedPrice or None, since
+# spans cycle through a handful of model names.
+_PRICING_CACHE: Dict[int, Tuple[Dict[str, Dict[str, float]], int, PrefixIndex, Dict[str, Optional[_ResolvedPrice]]]] = {}
+_PRICING_CACHE_MAX = 64
+_RESOLVED_MAX = 256
+
+
+def _table_entry(table: Dict[str, Dict[str, float]]):
+    entry = _PRICING_CACHE.get(id(table))
+    if entry is not None and entry[0] is table and entry[1] == len(table):
+        return entry
+    index = build_prefix_index((key.lower(), key) for key in table)
+    if len(_PRICING_CACHE) >= _PRICING_CACHE_MAX:
+        _PRICING_CACHE.clear()
+    entry = _PRICING_CACHE[id(table)] = (table, len(table), index, {})
+    return entry
+
+
+def clear_pricing_cache() -> None:
+    """Drop cached pricing lookups (call after mutating a pricing table in place)."""
+    _PRICING_CACHE.clear()
+
+
 def _lookup_price(model: str, table: Dict[str, Dict[str, float]]) -> Optional[Tuple[str, Dict[str, float]]]:
     """
     Return (matched_key, price_dict) for a given model name.
@@ -36,10 +67,34 @@ def _lookup_price(model: str, table: Dict[str, Dict[str, float]]) -> Optional[Tu
     if ml in table:
         return ml, table[ml]
     # prefix match (longest key wins)
-    for key in sorted(table.keys(), key=len, reverse=True):
-        if ml.startswith(key.lower()):
-            return key, table[key]
-    return None
+    key = match_longest_prefix(ml, _table_entry(table)[2])
+    if key is None:
+        return None
+    return key, table[key]
+
+
+def _resolve_price(model: str, table: Dict[str, Dict[str, float]]) -> Optional[_ResolvedPrice]:
+    """Memoized _lookup_price reduced to (key, per-token prompt price, per-token completion price)."""
+    if not isinstance(model, str):
+        matched = _lookup_price(model, table)
+        if not matched:
+            return None
+        key, price = matched
+        return key, price.get("prompt", 0.0) / 1000.0, price.get("completion", 0.0) / 1000.0
+    resolved = _table_entry(table)[3]
+    try:
+        return resolved[model]
+    except KeyError:
+        pass
+    matched = _lookup_price(model, table)
+    result = None
+    if matched:
+        key, price = matched
+        result = (key, price.get("prompt", 0.0) / 1000.0, price.get("completion", 0.0) / 1000.0)
+    if len(resolved) >= _RESOLVED_MAX:
+        resolved.clear()
+    resolved[model] = result
+    return result
 
 
 def match_pricing_model_key(
@@ -47,11 +102,10 @@ def match_pricing_model_key(
 ) -> Optional[str]:
     """Return the pricing table key that would be used for `model`, if any."""
     table = pricing_table or DEFAULT_PRICING
-    matched = _lookup_price(model, table)
-    if not matched:
+    resolved = _resolve_price(model, table)
+    if resolved is None:
         return None
-    key, _ = matched
-    return key
+    return resolved[0]
 
 
 def compute_cost(
@@ -61,11 +115,9 @@ def compute_cost(
     pricing_table: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> Optional[float]:
     table = pricing_table or DEFAULT_PRICING
-    matched = _lookup_price(model, table)
-    if not matched:
+    resolved = _resolve_price(model, table)
+    if resolved is None:
         return None
-    _, price = matched
-    prompt_cost = (prompt_tokens / 1000.0) * price.get("prompt", 0.0)
-    completion_cost = (completion_tokens / 1000.0) * price.get("completion", 0.0)
-    return round(prompt_cost + completion_cost, 6)
+    _, prompt_price, completion_price = resolved
+    return prompt_tokens * prompt_price + completion_tokens * completion_price
 
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
-from traccia.processors.cost_engine import compute_cost, match_pricing_model_key
+from traccia.processors.cost_engine import clear_pricing_cache, compute_cost, match_pricing_model_key
 from traccia.tracer.provider import SpanProcessor
+from traccia.utils.helpers import set_span_attributes
 
 
 class CostAnnotatingProcessor(SpanProcessor):
@@ -28,16 +29,18 @@ class CostAnnotatingProcessor(SpanProcessor):
         self.pricing_source = pricing_source
 
     def on_end(self, span) -> None:
-        if "llm.cost.usd" in (span.attributes or {}):
+        # Span.attributes re-syncs from the OTel span on every access; read it once.
+        attrs = span.attributes or {}
+        if "llm.cost.usd" in attrs:
             return
-        model = span.attributes.get("llm.model")
-        prompt = span.attributes.get("llm.usage.prompt_tokens")
-        completion = span.attributes.get("llm.usage.completion_tokens")
+        model = attrs.get("llm.model")
+        prompt = attrs.get("llm.usage.prompt_tokens")
+        completion = attrs.get("llm.usage.completion_tokens")
         # Anthropic-style names (also supported)
         if prompt is None:
-            prompt = span.attributes.get("llm.usage.input_tokens")
+            prompt = attrs.get("llm.usage.input_tokens")
         if completion is None:
-            completion = span.attributes.get("llm.usage.output_tokens")
+            completion = attrs.get("llm.usage.output_tokens")
         if not model or prompt is None or completion is None:
             return
         cost = compute_cost(
@@ -47,13 +50,16 @@ class CostAnnotatingProcessor(SpanProcessor):
             pricing_table=self.pricing_table,
         )
         if cost is not None:
-            span.set_attribute("llm.cost.usd", cost)
-            # Provenance for downstream analysis.
-            span.set_attribute("llm.cost.source", span.attributes.get("llm.usage.source", "unknown"))
-            span.set_attribute("llm.pricing.source", self.pricing_source)
+            updates = {
+                "llm.cost.usd": cost,
+                # Provenance for downstream analysis.
+                "llm.cost.source": attrs.get("llm.usage.source", "unknown"),
+                "llm.pricing.source": self.pricing_source,
+            }
             key = match_pricing_model_key(model, self.pricing_table)
             if key:
-                span.set_attribute("llm.pricing.model_key", key)
+                updates["llm.pricing.model_key"] = key
+            set_span_attributes(span, updates)
 
     def shutdown(self) -> None:
         return None
@@ -65,6 +71,8 @@ class CostAnnotatingProcessor(SpanProcessor):
         self, pricing_table: Dict[str, Dict[str, float]], pricing_source: Optional[str] = None
     ) -> None:
         self.pricing_table = pricing_table
+        clear_pricing_cache()
         if pricing_source:
             self.pricing_source = pricing_source
 
+
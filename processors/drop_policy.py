@@ -22,6 +22,10 @@ class DropOldestPolicy(DropPolicy):
     """Drop the oldest span to make room for a new one."""
 
     def handle(self, queue: Deque[Span], span: Span, max_size: int) -> bool:
+        if queue.maxlen == max_size:
+            # A bounded deque already evicts the oldest entry on append
+            queue.append(span)
+            return True
         if len(queue) >= max_size and queue:
             queue.popleft()
         if len(queue) < max_size:
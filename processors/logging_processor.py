@@ -15,13 +15,18 @@ class LoggingSpanProcessor(SpanProcessor):
         self.logger = logger or logging.getLogger("traccia.traces")
 
     def on_end(self, span) -> None:
-        attrs = span.attributes or {}
-        msg = (
-            f"[trace] name={span.name} trace_id={span.context.trace_id} "
-            f"span_id={span.context.span_id} status={span.status.name} "
-            f"duration_ns={span.duration_ns} attrs={attrs}"
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # Lazy %-formatting: attrs is only stringified if a handler emits the record
+        self.logger.info(
+            "[trace] name=%s trace_id=%s span_id=%s status=%s duration_ns=%s attrs=%s",
+            span.name,
+            span.context.trace_id,
+            span.context.span_id,
+            span.status.name,
+            span.duration_ns,
+            span.attributes or {},
         )
-        self.logger.info(msg)
 
     def shutdown(self) -> None:
         return None
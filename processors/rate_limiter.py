@@ -5,7 +5,6 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import deque
 from typing import Optional
 
 from opentelemetry.sdk.trace import ReadableSpan
@@ -14,6 +13,10 @@ from traccia.errors import RateLimitError
 
 logger = logging.getLogger(__name__)
 
+# Fixed-point scale for token bucket arithmetic (one token == _TOKEN units)
+_TOKEN = 1_000_000_000
+_WARN_INTERVAL_NS = 1_000_000_000
+
 
 class RateLimiter:
     """
@@ -26,6 +29,20 @@ class RateLimiter:
     - Thread-safe implementation
     """
     
+    __slots__ = (
+        "max_spans_per_second",
+        "max_block_ms",
+        "enabled",
+        "_tokens_scaled",
+        "_max_tokens_scaled",
+        "_last_refill_ns",
+        "_lock",
+        "_total_spans",
+        "_dropped_spans",
+        "_blocked_spans",
+        "_last_warn_ns",
+    )
+    
     def __init__(
         self,
         max_spans_per_second: Optional[float] = None,
@@ -42,10 +59,11 @@ class RateLimiter:
         self.max_block_ms = max_block_ms
         self.enabled = max_spans_per_second is not None and max_spans_per_second > 0
         
-        # Token bucket state
-        self._tokens: float = max_spans_per_second or 0
-        self._max_tokens: float = max_spans_per_second or 0
-        self._last_refill_time: float = time.time()
+        # Token bucket state, in integer units of 1/_TOKEN of a token so refills
+        # don't accumulate float error; timed on the monotonic clock.
+        self._max_tokens_scaled: int = int((max_spans_per_second or 0) * _TOKEN)
+        self._tokens_scaled: int = self._max_tokens_scaled
+        self._last_refill_ns: int = time.monotonic_ns()
         self._lock = threading.Lock()
         
         # Stats
@@ -53,9 +71,8 @@ class RateLimiter:
         self._dropped_spans = 0
         self._blocked_spans = 0
         
-        # Recent timestamps for sliding window (backup)
-        self._recent_timestamps: deque = deque()
-        self._window_seconds = 1.0
+        # Drop warnings are themselves rate limited so overload doesn't flood the log
+        self._last_warn_ns: int = self._last_refill_ns - _WARN_INTERVAL_NS
     
     def acquire(self, span: Optional[ReadableSpan] = None) -> bool:
         """
@@ -85,53 +102,62 @@ class RateLimiter:
             self._refill_tokens()
             
             # Try to acquire immediately
-            if self._tokens >= 1.0:
-                self._tokens -= 1.0
+            if self._tokens_scaled >= _TOKEN:
+                self._tokens_scaled -= _TOKEN
                 return True
-            
-            # No tokens available, try blocking
-            if self.max_block_ms > 0:
-                block_start = time.time()
-                blocked_ms = 0
+            deficit = _TOKEN - self._tokens_scaled
+        
+        # No tokens available, try blocking. Sleep for exactly the time the
+        # bucket needs to refill one token (bounded by the remaining budget)
+        # rather than polling, so waiting threads don't wake in lockstep.
+        if self.max_block_ms > 0:
+            # A scaled deficit divided by the rate is the refill time in ns
+            rate = self.max_spans_per_second
+            deadline = time.monotonic_ns() + self.max_block_ms * 1_000_000
+            while True:
+                remaining = deadline - time.monotonic_ns()
+                if remaining <= 0:
+                    break
+                time.sleep(min(deficit / rate, remaining) / 1e9)
                 
-                while blocked_ms < self.max_block_ms:
-                    # Release lock briefly to allow other threads
-                    self._lock.release()
-                    time.sleep(0.001)  # Sleep 1ms
-                    self._lock.acquire()
-                    
-                    # Refill and try again
+                with self._lock:
                     self._refill_tokens()
-                    if self._tokens >= 1.0:
-                        self._tokens -= 1.0
+                    if self._tokens_scaled >= _TOKEN:
+                        self._tokens_scaled -= _TOKEN
                         self._blocked_spans += 1
                         return True
-                    
-                    blocked_ms = (time.time() - block_start) * 1000
-            
+                    deficit = _TOKEN - self._tokens_scaled
+        
+        with self._lock:
             # Still no tokens after blocking - drop the span
             self._dropped_spans += 1
             
-            # Log dropped span
-            span_name = span.name if span else "unknown"
-            logger.warning(
-                f"Rate limit exceeded - dropping span '{span_name}'. "
-                f"Total dropped: {self._dropped_spans}/{self._total_spans} "
-                f"({self._dropped_spans / self._total_spans * 100:.1f}%)"
-            )
+            # Log dropped span (at most once per warn interval)
+            now = time.monotonic_ns()
+            if (
+                now - self._last_warn_ns >= _WARN_INTERVAL_NS
+                and logger.isEnabledFor(logging.WARNING)
+            ):
+                self._last_warn_ns = now
+                logger.warning(
+                    "Rate limit exceeded - dropping span '%s'. Total dropped: %d/%d",
+                    span.name if span else "unknown",
+                    self._dropped_spans,
+                    self._total_spans,
+                )
             
             return False
     
     def _refill_tokens(self) -> None:
         """Refill tokens based on elapsed time (token bucket algorithm)."""
-        now = time.time()
-        elapsed = now - self._last_refill_time
-        
-        if elapsed > 0:
-            # Add tokens based on rate and elapsed time
-            new_tokens = elapsed * self.max_spans_per_second
-            self._tokens = min(self._max_tokens, self._tokens + new_tokens)
-            self._last_refill_time = now
+        now = time.monotonic_ns()
+        elapsed_ns = now - self._last_refill_ns
+        
+        if elapsed_ns > 0:
+            # rate tokens/s * elapsed ns == elapsed * rate / 1e9 tokens == that many scaled units
+            new_tokens = int(elapsed_ns * self.max_spans_per_second)
+            self._tokens_scaled = min(self._max_tokens_scaled, self._tokens_scaled + new_tokens)
+            self._last_refill_ns = now
     
     def get_stats(self) -> dict:
         """Get rate limiting statistics."""
@@ -144,7 +170,7 @@ class RateLimiter:
                 "dropped_spans": self._dropped_spans,
                 "blocked_spans": self._blocked_spans,
                 "drop_rate_percent": round(drop_rate, 2),
-                "current_tokens": round(self._tokens, 2),
+                "current_tokens": round(self._tokens_scaled / _TOKEN, 2),
             }
     
     def reset_stats(self) -> None:
@@ -182,6 +208,14 @@ class RateLimitingSpanProcessor:
             max_spans_per_second=max_spans_per_second,
             max_block_ms=max_block_ms,
         )
+        
+        # Without a limit there is nothing to check: bind the hot hooks straight
+        # to the next processor so each span skips this wrapper's frame.
+        if not self.rate_limiter.enabled and next_processor is not None:
+            if hasattr(next_processor, 'on_start'):
+                self.on_start = next_processor.on_start
+            if hasattr(next_processor, 'on_end'):
+                self.on_end = next_processor.on_end
     
     def on_start(self, span, parent_context=None):
         """Called when span starts - pass through to next processor."""
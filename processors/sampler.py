@@ -4,11 +4,16 @@ import random
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class SamplingResult:
     sampled: bool
 
 
+# Decisions are immutable, so every call shares one of these two instances
+_SAMPLED = SamplingResult(sampled=True)
+_NOT_SAMPLED = SamplingResult(sampled=False)
+
+
 class Sampler:
     """Head-based sampler using a fixed probability."""
 
@@ -16,7 +21,12 @@ class Sampler:
         if not 0.0 <= sample_rate <= 1.0:
             raise ValueError("sample_rate must be between 0.0 and 1.0")
         self.sample_rate = sample_rate
+        self._random = random.random
 
     def should_sample(self) -> SamplingResult:
-        return SamplingResult(sampled=random.random() <= self.sample_rate)
-
+        rate = self.sample_rate
+        if rate >= 1.0:
+            return _SAMPLED
+        if rate <= 0.0:
+            return _NOT_SAMPLED
+        return _SAMPLED if self._random() <= rate else _NOT_SAMPLED
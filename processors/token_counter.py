@@ -8,9 +8,16 @@ Best practice:
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Dict, Optional, Tuple
 
 from traccia.tracer.provider import SpanProcessor
+from traccia.utils.helpers import (
+    PrefixIndex,
+    build_prefix_index,
+    match_longest_prefix,
+    set_span_attributes,
+)
 
 try:  # optional dependency for accurate counting
     import tiktoken  # type: ignore
@@ -26,13 +33,31 @@ MODEL_TO_ENCODING = {
     "gpt-3.5-turbo": "cl100k_base",
 }
 
+# Rebuilt whenever MODEL_TO_ENCODING changes size (entries added at runtime)
+_encoding_index: Optional[PrefixIndex] = None
+_encoding_index_size = -1
+
+
+def _encoding_name_for_prefix(model: str) -> Optional[str]:
+    global _encoding_index, _encoding_index_size
+    if _encoding_index is None or _encoding_index_size != len(MODEL_TO_ENCODING):
+        _encoding_index = build_prefix_index(MODEL_TO_ENCODING.items())
+        _encoding_index_size = len(MODEL_TO_ENCODING)
+    return match_longest_prefix(model, _encoding_index)
+
 
 def _encoding_for_model(model: Optional[str]):
     if tiktoken is None:
         return None
     if not model:
         return None
-    m = str(model)
+    # Keyed on the mapping size too, so models added at runtime aren't shadowed
+    # by a cached miss.
+    return _cached_encoding_for_model(str(model), len(MODEL_TO_ENCODING))
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_encoding_for_model(m: str, _mapping_size: int):
     # First try tiktoken's model registry (best when available).
     try:
         return tiktoken.encoding_for_model(m)
@@ -41,10 +66,7 @@ def _encoding_for_model(model: Optional[str]):
     # Then try our explicit mapping, supporting version-suffixed models by prefix.
     encoding_name = MODEL_TO_ENCODING.get(m)
     if encoding_name is None:
-        for key in sorted(MODEL_TO_ENCODING.keys(), key=len, reverse=True):
-            if m.startswith(key):
-                encoding_name = MODEL_TO_ENCODING[key]
-                break
+        encoding_name = _encoding_name_for_prefix(m)
     if encoding_name:
         try:
             return tiktoken.get_encoding(encoding_name)
@@ -53,6 +75,21 @@ def _encoding_for_model(model: Optional[str]):
     return None
 
 
+# Token counts for chat roles per encoding; roles come from a tiny vocabulary.
+_ROLE_TOKENS: Dict[Tuple[str, str], int] = {}
+_ROLE_TOKENS_MAX = 256
+
+
+def _role_token_count(encoding, role: str) -> int:
+    key = (encoding.name, role)
+    count = _ROLE_TOKENS.get(key)
+    if count is None:
+        count = len(encoding.encode(role))
+        if len(_ROLE_TOKENS) < _ROLE_TOKENS_MAX:
+            _ROLE_TOKENS[key] = count
+    return count
+
+
 def _count_with_tiktoken(text: str, model: Optional[str]) -> Optional[int]:
     if tiktoken is None or not text:
         return None
@@ -60,11 +97,23 @@ def _count_with_tiktoken(text: str, model: Optional[str]) -> Optional[int]:
     if encoding is None:
         return None
     try:
+        if len(text) <= _CACHED_TEXT_MAX_CHARS:
+            return _cached_token_count(encoding, text)
         return len(encoding.encode(text))
     except Exception:
         return None
 
 
+# System prompts and tool descriptions repeat across spans; remember counts for
+# short texts (long ones would pin too much memory in the cache).
+_CACHED_TEXT_MAX_CHARS = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_token_count(encoding, text: str) -> int:
+    return len(encoding.encode(text))
+
+
 def estimate_tokens_from_text(text: str, model: Optional[str] = None) -> int:
     """
     Estimate tokens. Prefer model-accurate count via tiktoken when available,
@@ -94,6 +143,20 @@ def estimate_tokens_from_text_with_source(
     return len(text.split()), "estimated.heuristic"
 
 
+# tiktoken's encode_batch spins up a thread pool per call, which only pays off
+# once there are enough texts to spread across it.
+_ENCODE_BATCH_MIN = 16
+
+
+def _encoded_length(encoding, texts) -> int:
+    """Total token count of texts, batching the encode for long conversations."""
+    if len(texts) >= _ENCODE_BATCH_MIN and hasattr(encoding, "encode_batch"):
+        return sum(map(len, encoding.encode_batch(texts)))
+    encode = encoding.encode
+    return sum(len(encode(text)) for text in texts)
+
+
+@functools.lru_cache(maxsize=32)
 def _openai_chat_overhead(model: Optional[str]) -> Tuple[int, int, int]:
     """
     Return (tokens_per_message, tokens_per_name, tokens_for_reply).
@@ -136,20 +199,25 @@ def estimate_openai_chat_prompt_tokens_with_source(
 
     tokens_per_message, tokens_per_name, tokens_for_reply = _openai_chat_overhead(model)
     total = 0
-    for msg in list(messages)[:50]:
+    texts = []
+    # messages is a list or tuple here, so slicing already copies
+    for msg in messages[:50]:
         if not isinstance(msg, dict):
             continue
+        mget = msg.get
         total += tokens_per_message
-        role = msg.get("role") or ""
-        name = msg.get("name")
-        content = msg.get("content") or ""
-        if not isinstance(content, str):
-            content = str(content)
-        total += len(encoding.encode(str(role)))
-        total += len(encoding.encode(content))
+        role = mget("role") or ""
+        if type(role) is not str:
+            role = str(role)
+        total += _role_token_count(encoding, role)
+        content = mget("content")
+        if content:
+            texts.append(content if type(content) is str else str(content))
+        name = mget("name")
         if name:
             total += tokens_per_name
-            total += len(encoding.encode(str(name)))
+            texts.append(name if type(name) is str else str(name))
+    total += _encoded_length(encoding, texts)
     total += tokens_for_reply
     return total, "estimated.tiktoken_chat"
 
@@ -161,52 +229,54 @@ class TokenCountingProcessor(SpanProcessor):
     """
 
     def on_end(self, span) -> None:
-        prompt = span.attributes.get("llm.prompt")
-        completion = span.attributes.get("llm.completion")
-        model = span.attributes.get("llm.model")
-        openai_messages = span.attributes.get("llm.openai.messages")
-
-        wrote_any = False
-        wrote_prompt = False
-        wrote_completion = False
-
-        if "llm.usage.prompt_tokens" not in span.attributes:
+        # Span.attributes re-syncs from the OTel span on every access; read it once.
+        attrs = span.attributes or {}
+        # Provider-reported usage leaves nothing to estimate (the common case).
+        has_prompt_tokens = "llm.usage.prompt_tokens" in attrs
+        has_completion_tokens = "llm.usage.completion_tokens" in attrs
+        if has_prompt_tokens and has_completion_tokens:
+            return
+        prompt = attrs.get("llm.prompt")
+        completion = attrs.get("llm.completion")
+        model = attrs.get("llm.model")
+        openai_messages = attrs.get("llm.openai.messages")
+
+        updates: Dict[str, Any] = {}
+
+        if not has_prompt_tokens:
             # Prefer chat-structure estimation when available.
             est = estimate_openai_chat_prompt_tokens_with_source(openai_messages, model)
             if est is not None:
                 count, source = est
-                span.set_attribute("llm.usage.prompt_tokens", count)
-                span.set_attribute("llm.usage.prompt_source", source)
-                wrote_any = True
-                wrote_prompt = True
+                updates["llm.usage.prompt_tokens"] = count
+                updates["llm.usage.prompt_source"] = source
             elif isinstance(prompt, str):
                 count, source = estimate_tokens_from_text_with_source(prompt, model)
-                span.set_attribute("llm.usage.prompt_tokens", count)
-                span.set_attribute("llm.usage.prompt_source", source)
-                wrote_any = True
-                wrote_prompt = True
+                updates["llm.usage.prompt_tokens"] = count
+                updates["llm.usage.prompt_source"] = source
 
-        if "llm.usage.completion_tokens" not in span.attributes and isinstance(completion, str):
+        if not has_completion_tokens and isinstance(completion, str):
             count, source = estimate_tokens_from_text_with_source(completion, model)
-            span.set_attribute("llm.usage.completion_tokens", count)
-            span.set_attribute("llm.usage.completion_source", source)
-            wrote_any = True
-            wrote_completion = True
-
-        # Synthesize overall usage source if not provided by instrumentation.
-        if wrote_any and "llm.usage.source" not in span.attributes:
-            ps = span.attributes.get("llm.usage.prompt_source")
-            cs = span.attributes.get("llm.usage.completion_source")
+            updates["llm.usage.completion_tokens"] = count
+            updates["llm.usage.completion_source"] = source
+
+        if not updates:
+            return
+
+        usage_source = attrs.get("llm.usage.source")
+        if usage_source is None:
+            # Synthesize overall usage source if not provided by instrumentation.
+            ps = updates.get("llm.usage.prompt_source", attrs.get("llm.usage.prompt_source"))
+            cs = updates.get("llm.usage.completion_source", attrs.get("llm.usage.completion_source"))
             if ps and cs and ps == cs:
-                span.set_attribute("llm.usage.source", ps)
+                updates["llm.usage.source"] = ps
             elif ps or cs:
-                span.set_attribute("llm.usage.source", "mixed")
+                updates["llm.usage.source"] = "mixed"
+        elif usage_source == "provider_usage":
+            # Provider marked usage as provider_usage but we filled missing fields.
+            updates["llm.usage.source"] = "mixed"
 
-        # If provider already marked usage as provider_usage, and we filled any missing
-        # fields, mark it as mixed.
-        if wrote_any and span.attributes.get("llm.usage.source") == "provider_usage":
-            if wrote_prompt or wrote_completion:
-                span.set_attribute("llm.usage.source", "mixed")
+        set_span_attributes(span, updates)
 
     def shutdown(self) -> None:
         return None
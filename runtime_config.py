@@ -1,138 +1,177 @@
 """Runtime configuration state management."""
 
-from typing import Optional, List, Any
-
-# Global runtime configuration state
-_config = {
-    "auto_instrument_tools": False,
-    "tool_include": [],
-    "max_tool_spans": 1000,
-    "max_span_depth": 100,
-    "session_id": None,
-    "user_id": None,
-    "tenant_id": None,
-    "project_id": None,
-    "agent_id": None,
-    "debug": False,
-    "attr_truncation_limit": 1000,
-    "openai_agents": True,
-    "crewai": True,
-}
+from typing import Any, Dict, List, Optional
+
+class _RuntimeConfig:
+    """Global runtime configuration state; slotted so hot-path getters are plain attribute loads."""
+
+    __slots__ = (
+        "auto_instrument_tools",
+        "tool_include",
+        "max_tool_spans",
+        "max_span_depth",
+        "trace_result",
+        "session_id",
+        "user_id",
+        "tenant_id",
+        "project_id",
+        "agent_id",
+        "debug",
+        "attr_truncation_limit",
+        "openai_agents",
+        "crewai",
+        "extra",
+    )
+
+    def __init__(self) -> None:
+        self.auto_instrument_tools: bool = False
+        self.tool_include: List[str] = []
+        self.max_tool_spans: int = 1000
+        self.max_span_depth: Optional[int] = None  # None = unlimited
+        self.trace_result: bool = True
+        self.session_id: Optional[str] = None
+        self.user_id: Optional[str] = None
+        self.tenant_id: Optional[str] = None
+        self.project_id: Optional[str] = None
+        self.agent_id: Optional[str] = None
+        self.debug: bool = False
+        self.attr_truncation_limit: int = 1000
+        self.openai_agents: bool = True
+        self.crewai: bool = True
+        # Keys outside the fields above, set through set_config_value()
+        self.extra: Dict[str, Any] = {}
+
+
+_config = _RuntimeConfig()
+_FIELDS = frozenset(_RuntimeConfig.__slots__) - {"extra"}
 
 
 def set_auto_instrument_tools(value: bool) -> None:
-    _config["auto_instrument_tools"] = value
+    _config.auto_instrument_tools = value
 
 
 def get_auto_instrument_tools() -> bool:
-    return _config["auto_instrument_tools"]
+    return _config.auto_instrument_tools
 
 
 def set_tool_include(value: List[str]) -> None:
-    _config["tool_include"] = value
+    _config.tool_include = value
 
 
 def get_tool_include() -> List[str]:
-    return _config["tool_include"]
+    return _config.tool_include
 
 
 def set_max_tool_spans(value: int) -> None:
-    _config["max_tool_spans"] = value
+    _config.max_tool_spans = value
 
 
 def get_max_tool_spans() -> int:
-    return _config["max_tool_spans"]
+    return _config.max_tool_spans
 
 
-def set_max_span_depth(value: int) -> None:
-    _config["max_span_depth"] = value
+def set_max_span_depth(value: Optional[int]) -> None:
+    _config.max_span_depth = value
 
 
-def get_max_span_depth() -> int:
-    return _config["max_span_depth"]
+def get_max_span_depth() -> Optional[int]:
+    return _config.max_span_depth
+
+
+def set_trace_result(value: bool) -> None:
+    _config.trace_result = value
+
+
+def get_trace_result() -> bool:
+    return _config.trace_result
 
 
 def set_session_id(value: Optional[str]) -> None:
-    _config["session_id"] = value
+    _config.session_id = value
 
 
 def get_session_id() -> Optional[str]:
-    return _config["session_id"]
+    return _config.session_id
 
 
 def set_user_id(value: Optional[str]) -> None:
-    _config["user_id"] = value
+    _config.user_id = value
 
 
 def get_user_id() -> Optional[str]:
-    return _config["user_id"]
+    return _config.user_id
 
 
 def set_tenant_id(value: Optional[str]) -> None:
-    _config["tenant_id"] = value
+    _config.tenant_id = value
 
 
 def get_tenant_id() -> Optional[str]:
-    return _config["tenant_id"]
+    return _config.tenant_id
 
 
 def set_project_id(value: Optional[str]) -> None:
-    _config["project_id"] = value
+    _config.project_id = value
 
 
 def get_project_id() -> Optional[str]:
-    return _config["project_id"]
+    return _config.project_id
 
 
 def set_agent_id(value: Optional[str]) -> None:
-    _config["agent_id"] = value
+    _config.agent_id = value
 
 
 def get_agent_id() -> Optional[str]:
-    return _config["agent_id"]
+    return _config.agent_id
 
 
 def set_debug(value: bool) -> None:
-    _config["debug"] = value
+    _config.debug = value
 
 
 def get_debug() -> bool:
-    return _config["debug"]
+    return _config.debug
 
 
 def set_attr_truncation_limit(value: int) -> None:
-    _config["attr_truncation_limit"] = value
+    _config.attr_truncation_limit = value
 
 
 def get_attr_truncation_limit() -> int:
-    return _config["attr_truncation_limit"]
+    return _config.attr_truncation_limit
 
 
 def get_openai_agents() -> bool:
     """Get whether OpenAI Agents SDK integration is enabled."""
-    return _config.get("openai_agents", True)
+    return _config.openai_agents
 
 
 def set_openai_agents(value: bool) -> None:
     """Set whether OpenAI Agents SDK integration is enabled."""
-    _config["openai_agents"] = value
+    _config.openai_agents = value
 
 
 def get_crewai() -> bool:
     """Get whether CrewAI integration is enabled."""
-    return _config.get("crewai", True)
+    return _config.crewai
 
 
 def set_crewai(value: bool) -> None:
     """Set whether CrewAI integration is enabled."""
-    _config["crewai"] = value
+    _config.crewai = value
 
 
 def set_config_value(key: str, value: Any) -> None:
     """Set a runtime config value."""
-    _config[key] = value
+    if key in _FIELDS:
+        setattr(_config, key, value)
+    else:
+        _config.extra[key] = value
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
     """Get a runtime config value."""
-    return _config.get(key, default)
+    if key in _FIELDS:
+        return getattr(_config, key)
+    return _config.extra.get(key, default)
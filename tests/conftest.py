@@ -0,0 +1,142 @@
+"""Shared pytest fixtures for the Traccia test suite."""
+
+import asyncio
+
+import pytest
+
+from traccia import auto, end_auto_trace, init, stop_tracing
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even without pytest-xdist installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run these tests on the same pytest-xdist worker"
+    )
+
+
+class InMemoryExporter:
+    """
+    Stand-in for the network exporters during tests.
+
+    Exported spans are kept in memory (shared across instances, since each
+    init() builds a new exporter), so no test waits on an unreachable
+    collector while stop_tracing() flushes.
+    """
+
+    _finished_spans = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def export(self, spans) -> bool:
+        InMemoryExporter._finished_spans.extend(spans)
+        return True
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+    def shutdown(self) -> None:
+        return None
+
+    @classmethod
+    def get_finished_spans(cls):
+        return list(cls._finished_spans)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._finished_spans.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _in_memory_exporter():
+    """Route every init()/start_tracing() in the suite to InMemoryExporter."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auto, "OTLPExporter", InMemoryExporter)
+        mp.setattr(auto, "HttpExporter", InMemoryExporter)
+        yield InMemoryExporter
+
+
+@pytest.fixture(scope="module")
+def traccia_provider():
+    """Initialize the SDK once per module instead of once per test."""
+    provider = init(enable_patching=False, auto_start_trace=False)
+    yield provider
+    stop_tracing()
+
+
+@pytest.fixture
+def reset_tracing():
+    """Stop whatever tracing a test set up, ignoring errors during teardown."""
+    yield
+    try:
+        stop_tracing()
+    except Exception:
+        pass
+
+
+@pytest.fixture
+def auto_trace(traccia_provider):
+    """Start an auto-trace on the shared provider and end it after the test."""
+    auto._auto_trace_context = auto._start_auto_trace(traccia_provider, auto._auto_trace_name)
+    yield auto._auto_trace_context
+    end_auto_trace()
+
+
+@pytest.fixture
+def captured_spans(traccia_provider):
+    """
+    Spans exported during the test.
+
+    Yields a callable that flushes the active processor and returns the
+    finished spans.
+    """
+    InMemoryExporter.clear()
+
+    def get_finished_spans():
+        if auto._active_processor is not None:
+            auto._active_processor.force_flush()
+        return InMemoryExporter.get_finished_spans()
+
+    yield get_finished_spans
+    InMemoryExporter.clear()
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """One event loop per module, shared by tests that drive coroutines."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+# TOML blobs shared by the configuration tests, written to disk once per session
+_SAMPLE_CONFIGS = {
+    "basic": """
+[tracing]
+sample_rate = 0.7
+use_otlp = false
+
+[exporters]
+enable_console = true
+
+[instrumentation]
+enable_patching = false
+""",
+    "priority": """
+[tracing]
+sample_rate = 0.5
+endpoint = "http://file:4318/v1/traces"
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def sample_config_files(tmp_path_factory):
+    """Paths to the sample config files, keyed by name."""
+    config_dir = tmp_path_factory.mktemp("cfg")
+    paths = {}
+    for name, content in _SAMPLE_CONFIGS.items():
+        path = config_dir / f"{name}.toml"
+        path.write_text(content)
+        paths[name] = str(path)
+    return paths
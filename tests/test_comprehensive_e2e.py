@@ -5,15 +5,76 @@ instrumentations, and configurations.
 """
 
 import pytest
-import tempfile
-import os
 import time
 from pathlib import Path
 
 import traccia
-from traccia import observe
+from traccia import observe, runtime_config
 from traccia.config import load_config, validate_config
+from traccia.context import get_current_span
 from traccia.errors import ConfigError
+from traccia.processors.rate_limiter import RateLimiter
+
+
+# Decorated once at import so the tests below only pay for the calls
+@observe(name="add_numbers")
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+@observe(
+    name="process_data",
+    attributes={"component": "processor", "version": "1.0"}
+)
+def process(data: str) -> str:
+    return data.upper()
+
+
+@observe(
+    name="tagged_function",
+    tags=["ingest", "critical"],
+)
+def tagged():
+    return "ok"
+
+
+@observe(name="login", skip_args=["password"])
+def login(username: str, password: str) -> bool:
+    return username == "admin" and password == "secret"
+
+
+@observe(name="get_token", skip_result=True)
+def get_token() -> str:
+    return "sensitive-token-123"
+
+
+@observe(name="failing_function")
+def fail():
+    raise ValueError("Test error message")
+
+
+@observe(name="recurse")
+def recurse(n: int) -> list:
+    span_id = get_current_span().context.span_id
+    return [span_id] + (recurse(n - 1) if n else [])
+
+
+@observe(name="error_function")
+def raise_error():
+    raise RuntimeError("Something went wrong")
+
+
+@observe(name="inner")
+def inner():
+    raise KeyError("Inner error")
+
+
+@observe(name="outer")
+def outer():
+    try:
+        inner()
+    except KeyError:
+        raise ValueError("Outer error")
 
 
 class TestInstrumentation:
@@ -21,83 +82,102 @@ class TestInstrumentation:
     
     def test_observe_decorator_basic(self):
         """Test @observe decorator on simple functions."""
-        @observe(name="add_numbers")
-        def add(a: int, b: int) -> int:
-            return a + b
-        
         result = add(5, 3)
         assert result == 8
     
     def test_observe_decorator_with_attributes(self):
         """Test @observe decorator with custom attributes."""
-        @observe(
-            name="process_data",
-            attributes={"component": "processor", "version": "1.0"}
-        )
-        def process(data: str) -> str:
-            return data.upper()
-        
         result = process("hello")
         assert result == "HELLO"
     
-    def test_observe_decorator_with_tags(self):
+    def test_observe_decorator_with_tags(self, captured_spans):
         """Test @observe decorator with custom tags."""
-        from traccia.context import get_current_span
-
-        captured_tags = {}
-
-        @observe(
-            name="tagged_function",
-            tags=["ingest", "critical"],
-        )
-        def tagged():
-            span = get_current_span()
-            assert span is not None
-            # Access attributes to force sync from underlying OTel span
-            attrs = span.attributes
-            captured_tags["value"] = attrs.get("span.tags")
-            return "ok"
-
         result = tagged()
         assert result == "ok"
+        spans = [span for span in captured_spans() if span.name == "tagged_function"]
+        assert len(spans) == 1
         # OpenTelemetry may normalize list attributes to tuples internally
-        assert list(captured_tags["value"]) == ["ingest", "critical"]
+        assert list(spans[0].attributes["span.tags"]) == ["ingest", "critical"]
     
     def test_observe_decorator_skip_args(self):
         """Test @observe decorator with argument skipping."""
-        @observe(name="login", skip_args=["password"])
-        def login(username: str, password: str) -> bool:
-            return username == "admin" and password == "secret"
-        
         result = login("admin", "secret")
         assert result is True
     
-    def test_observe_decorator_skip_result(self):
+    def test_observe_decorator_skip_result(self, captured_spans):
         """Test @observe decorator with result skipping."""
-        @observe(name="get_token", skip_result=True)
-        def get_token() -> str:
-            return "sensitive-token-123"
-        
         result = get_token()
         assert result == "sensitive-token-123"
+        spans = [span for span in captured_spans() if span.name == "get_token"]
+        assert len(spans) == 1
+        assert "result" not in spans[0].attributes
+        assert "result.type" not in spans[0].attributes
+    
+    def test_observe_decorator_trace_result_disabled(self, captured_spans):
+        """Test that trace_result=False records only the result type name."""
+        runtime_config.set_trace_result(False)
+        try:
+            result = tagged()
+        finally:
+            runtime_config.set_trace_result(True)
+        
+        assert result == "ok"
+        spans = [span for span in captured_spans() if span.name == "tagged_function"]
+        assert len(spans) == 1
+        assert "result" not in spans[0].attributes
+        assert spans[0].attributes["result.type"] == "str"
     
     def test_observe_decorator_error_handling(self):
         """Test @observe decorator records errors."""
-        @observe(name="failing_function")
-        def fail():
-            raise ValueError("Test error message")
-        
         with pytest.raises(ValueError, match="Test error message"):
             fail()
+    
+    def test_observe_decorator_respects_max_span_depth(self):
+        """Test that @observe stops creating spans past max_span_depth."""
+        previous = runtime_config.get_max_span_depth()
+        runtime_config.set_max_span_depth(2)
+        try:
+            span_ids = recurse(4)
+        finally:
+            runtime_config.set_max_span_depth(previous)
+        
+        assert len(set(span_ids)) == 2
+    
+    def test_observe_decorator_depth_unlimited_by_default(self, traccia_provider):
+        """Test that init() leaves @observe nesting unlimited unless max_span_depth is set."""
+        assert runtime_config.get_max_span_depth() is None
+        span_ids = recurse(15)
+        
+        assert len(set(span_ids)) == 16
+
+
+class FakeClock:
+    """Stands in for the time module in rate_limiter; sleep() only advances virtual time."""
+    
+    def __init__(self):
+        self.now_ns = 1_000_000_000
+    
+    def monotonic_ns(self) -> int:
+        return self.now_ns
+    
+    def sleep(self, seconds: float) -> None:
+        self.now_ns += int(seconds * 1e9)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    from traccia.processors import rate_limiter
+    
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
 
 
 class TestRateLimiting:
     """Test rate limiting functionality."""
     
-    def test_rate_limiter_drops_excess_spans(self):
+    def test_rate_limiter_drops_excess_spans(self, fake_clock):
         """Test that rate limiting drops spans beyond limit."""
-        from traccia.processors.rate_limiter import RateLimiter
-        
         # Very restrictive: 2 spans/second, no blocking
         limiter = RateLimiter(max_spans_per_second=2.0, max_block_ms=0)
         
@@ -111,63 +191,39 @@ class TestRateLimiting:
         assert stats["total_spans"] == 5
         assert stats["dropped_spans"] == 3
     
-    def test_rate_limiter_with_blocking(self):
+    def test_rate_limiter_with_blocking(self, fake_clock):
         """Test rate limiting with short blocking period."""
-        from traccia.processors.rate_limiter import RateLimiter
-        
-        # Allow blocking up to 100ms
+        # Allow blocking up to 100ms; the bucket starts with 10 tokens
         limiter = RateLimiter(max_spans_per_second=10.0, max_block_ms=100)
+        start_ns = fake_clock.now_ns
         
-        # Should be able to acquire multiple times
-        # (some may block briefly)
-        results = []
-        for _ in range(5):
-            results.append(limiter.acquire())
+        results = [limiter.acquire() for _ in range(15)]
         
-        # Most should succeed due to blocking
-        assert sum(results) >= 3
+        # Past the initial burst each span waits ~100ms for a token, which
+        # fits within max_block_ms, so nothing is dropped
+        assert all(results)
+        stats = limiter.get_stats()
+        assert stats["blocked_spans"] == 5
+        assert stats["dropped_spans"] == 0
+        assert fake_clock.now_ns - start_ns >= 0.5e9 - 1e6
 
 
 class TestConfigurationScenarios:
-    """Test different configuration scenarios."""
-    
-    def teardown_method(self):
-        """Clean up env vars after each test."""
-        for key in list(os.environ.keys()):
-            if key.startswith("TRACCIA_") or key.startswith("AGENT_DASHBOARD_"):
-                del os.environ[key]
+    """Test different configuration scenarios (env vars go through monkeypatch)."""
     
-    def test_config_from_file(self):
+    def test_config_from_file(self, sample_config_files):
         """Test loading configuration from TOML file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-            f.write("""
-[tracing]
-sample_rate = 0.7
-use_otlp = false
-
-[exporters]
-enable_console = true
-
-[instrumentation]
-enable_patching = false
-""")
-            f.flush()
-            config_file = f.name
-        
-        try:
-            config = load_config(config_file=config_file)
-            assert config.tracing.sample_rate == 0.7
-            assert config.tracing.use_otlp is False
-            assert config.exporters.enable_console is True
-            assert config.instrumentation.enable_patching is False
-        finally:
-            os.unlink(config_file)
+        config = load_config(config_file=sample_config_files["basic"])
+        assert config.tracing.sample_rate == 0.7
+        assert config.tracing.use_otlp is False
+        assert config.exporters.enable_console is True
+        assert config.instrumentation.enable_patching is False
     
-    def test_config_from_env_vars(self):
+    def test_config_from_env_vars(self, monkeypatch):
         """Test loading configuration from environment variables."""
-        os.environ["TRACCIA_SAMPLE_RATE"] = "0.8"
-        os.environ["TRACCIA_ENDPOINT"] = "http://custom:4318/v1/traces"
-        os.environ["TRACCIA_DEBUG"] = "true"
+        monkeypatch.setenv("TRACCIA_SAMPLE_RATE", "0.8")
+        monkeypatch.setenv("TRACCIA_ENDPOINT", "http://custom:4318/v1/traces")
+        monkeypatch.setenv("TRACCIA_DEBUG", "true")
         
         config = load_config()
         
@@ -175,62 +231,46 @@ enable_patching = false
         assert config.tracing.endpoint == "http://custom:4318/v1/traces"
         assert config.logging.debug is True
     
-    def test_config_priority(self):
+    def test_config_priority_explicit_over_env(self, sample_config_files, monkeypatch):
         """Test configuration priority: explicit > env > file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-            f.write("""
-[tracing]
-sample_rate = 0.5
-endpoint = "http://file:4318/v1/traces"
-""")
-            f.flush()
-            config_file = f.name
+        # Set env var
+        monkeypatch.setenv("TRACCIA_SAMPLE_RATE", "0.7")
         
-        try:
-            # Set env var
-            os.environ["TRACCIA_SAMPLE_RATE"] = "0.7"
-            
-            # Explicit override
-            overrides = {
-                "tracing": {
-                    "sample_rate": 0.9
-                }
+        # Explicit override
+        overrides = {
+            "tracing": {
+                "sample_rate": 0.9
             }
-            
-            config = load_config(config_file=config_file, overrides=overrides)
-            
-            # Explicit should win
-            assert config.tracing.sample_rate == 0.9
-        finally:
-            os.unlink(config_file)
+        }
+        
+        config = load_config(config_file=sample_config_files["priority"], overrides=overrides)
+        
+        # Explicit should win
+        assert config.tracing.sample_rate == 0.9
     
-    def test_invalid_config_validation(self):
-        """Test that invalid configs are caught."""
-        # Sample rate > 1.0
-        is_valid, msg, config = validate_config(
-            overrides={"tracing": {"sample_rate": 1.5}}
-        )
-        assert not is_valid
-        assert config is None
+    def test_config_priority_file_without_overrides(self, sample_config_files):
+        """Test that file values apply when nothing overrides them."""
+        config = load_config(config_file=sample_config_files["priority"])
         
-        # Sample rate < 0
-        is_valid, msg, config = validate_config(
-            overrides={"tracing": {"sample_rate": -0.1}}
-        )
-        assert not is_valid
+        assert config.tracing.sample_rate == 0.5
+        assert config.tracing.endpoint == "http://file:4318/v1/traces"
     
-    def test_conflicting_exporters_validation(self):
-        """Test that conflicting exporters are detected."""
-        is_valid, msg, config = validate_config(
-            overrides={
-                "exporters": {
-                    "enable_console": True,
-                    "enable_file": True,
-                }
-            }
-        )
-        # Should fail - can't have multiple exporters
-        assert not is_valid
+    @pytest.mark.parametrize(
+        "overrides, expected_valid",
+        [
+            # Sample rate out of range
+            ({"tracing": {"sample_rate": 1.5}}, False),
+            ({"tracing": {"sample_rate": -0.1}}, False),
+            ({"tracing": {"sample_rate": 0.5}}, True),
+            # Can't have multiple exporters
+            ({"exporters": {"enable_console": True, "enable_file": True}}, False),
+        ],
+    )
+    def test_validate_config(self, overrides, expected_valid):
+        """Test that invalid and conflicting configs are caught."""
+        is_valid, msg, config = validate_config(overrides=overrides)
+        assert is_valid is expected_valid
+        assert (config is not None) is expected_valid
 
 
 class TestErrorHandling:
@@ -238,26 +278,11 @@ class TestErrorHandling:
     
     def test_exception_in_decorated_function(self):
         """Test that exceptions are properly recorded and re-raised."""
-        @observe(name="error_function")
-        def raise_error():
-            raise RuntimeError("Something went wrong")
-        
         with pytest.raises(RuntimeError, match="Something went wrong"):
             raise_error()
     
     def test_nested_exceptions(self):
         """Test handling of nested exceptions."""
-        @observe(name="outer")
-        def outer():
-            @observe(name="inner")
-            def inner():
-                raise KeyError("Inner error")
-            
-            try:
-                inner()
-            except KeyError:
-                raise ValueError("Outer error")
-        
         with pytest.raises(ValueError, match="Outer error"):
             outer()
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import unittest
 import tempfile
 from io import StringIO
@@ -9,12 +10,13 @@ from io import StringIO
 from traccia import get_tracer, get_tracer_provider, set_tracer_provider
 from traccia.tracer import TracerProvider, Span, SpanStatus
 from traccia.tracer.span_context import SpanContext
-from traccia.context import get_current_span
+from traccia.context import get_current_span, span_scope
 from traccia.exporter import ConsoleExporter, FileExporter, HttpExporter, OTLPExporter
 from traccia.context.propagators import (
     format_traceparent, parse_traceparent,
     inject_traceparent, extract_traceparent,
     format_tracestate, parse_tracestate,
+    inject_tracestate, extract_trace_context,
 )
 
 
@@ -48,7 +50,18 @@ class TestSpanCreation(unittest.TestCase):
         self.assertEqual(span.attributes["key2"], 42)
         self.assertEqual(span.attributes["key3"], True)
         span.end()
-    
+
+    def test_span_attribute_list_mutated_in_place(self):
+        """Test that re-setting a mutated list attribute reaches the OTel span."""
+        span = self.tracer.start_span("test_span")
+        tags = ["a"]
+        span.set_attribute("tags", tags)
+        tags.append("b")
+        span.set_attribute("tags", tags)
+
+        self.assertEqual(tuple(span._otel_span.attributes["tags"]), ("a", "b"))
+        span.end()
+
     def test_span_status(self):
         """Test setting span status."""
         span = self.tracer.start_span("test_span")
@@ -107,6 +120,78 @@ class TestContextManagement(unittest.TestCase):
             
             # Back to parent
             self.assertEqual(get_current_span().name, "parent")
+    
+    def test_current_span_is_active_wrapper(self):
+        """Test that get_current_span returns the span entered as current."""
+        with self.tracer.start_as_current_span("outer") as outer:
+            self.assertIs(get_current_span(), outer)
+            with self.tracer.start_as_current_span("inner") as inner:
+                self.assertIs(get_current_span(), inner)
+            self.assertIs(get_current_span(), outer)
+
+    def test_span_scope(self):
+        """Test that span_scope activates a started span without ending it."""
+        span = self.tracer.start_span("scoped")
+        with span_scope(span):
+            self.assertIs(get_current_span(), span)
+            with self.tracer.start_as_current_span("child") as child:
+                self.assertEqual(child.parent_span_id, span.context.span_id)
+        self.assertIsNone(get_current_span())
+        self.assertFalse(span._ended)
+        span.end()
+
+    def test_push_span_token_detaches_with_otel(self):
+        """Test that push_span returns a plain OTel context token."""
+        from opentelemetry import context as context_api
+        from traccia.context import push_span
+        
+        span = self.tracer.start_span("pushed")
+        token = push_span(span)
+        self.assertIs(get_current_span(), span)
+        context_api.detach(token)
+        self.assertIsNone(get_current_span())
+        span.end()
+
+    def test_span_exit_in_other_context(self):
+        """Test that exiting a span in a different Context doesn't raise."""
+        import contextvars
+        
+        span = self.tracer.start_as_current_span("handoff")
+        span.__enter__()
+        token = span._activation_token
+        with self.assertLogs("opentelemetry.context", level="ERROR"):
+            contextvars.copy_context().run(span.__exit__, None, None, None)
+        self.assertTrue(span._ended)
+        
+        # The detach failed in the other Context; restore this one
+        from opentelemetry import context as context_api
+        context_api.detach(token)
+        self.assertIsNone(get_current_span())
+
+
+class TestSampling(unittest.TestCase):
+    """Test head-based sampling."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        from traccia.processors.sampler import Sampler
+        
+        self.provider = TracerProvider()
+        self.provider.set_sampler(Sampler(0.0))
+        set_tracer_provider(self.provider)
+        self.tracer = get_tracer("test")
+    
+    def test_unsampled_trace_is_not_recorded(self):
+        """Test that observed calls inside an unsampled trace create no spans."""
+        from traccia import observe
+        
+        @observe()
+        def child():
+            return get_current_span()
+        
+        with self.tracer.start_as_current_span("root") as root:
+            self.assertFalse(root._otel_span.is_recording())
+            self.assertIs(child(), root)
 
 
 class TestPropagation(unittest.TestCase):
@@ -131,6 +216,30 @@ class TestPropagation(unittest.TestCase):
         self.assertEqual(parsed.trace_id, ctx.trace_id)
         self.assertEqual(parsed.span_id, ctx.span_id)
     
+    def test_format_traceparent_matches_otel(self):
+        """Test that the direct formatter agrees with OTel's propagator."""
+        for flags in (0, 1):
+            ctx = SpanContext(trace_id="a" * 32, span_id="b" * 16, trace_flags=flags)
+            self.assertEqual(format_traceparent(ctx), format_traceparent(ctx, strict=True))
+
+    def test_parse_traceparent_rejects_invalid(self):
+        """Test that malformed or all-zero traceparent headers are rejected."""
+        self.assertIsNone(parse_traceparent("00-" + "0" * 32 + "-" + "b" * 16 + "-01"))
+        self.assertIsNone(parse_traceparent("00-" + "a" * 32 + "-" + "0" * 16 + "-01"))
+        self.assertIsNone(parse_traceparent("not-a-traceparent"))
+
+        parsed = parse_traceparent("00-" + "a" * 32 + "-" + "b" * 16 + "-00")
+        self.assertIsNotNone(parsed)
+        self.assertEqual(parsed.trace_flags, 0)
+
+    def test_parse_traceparent_keeps_all_flag_bits(self):
+        """Test that the regex fast path and the OTel fallback agree on trace flags."""
+        header = "00-" + "a" * 32 + "-" + "b" * 16 + "-03"
+        fast = parse_traceparent(header)
+        slow = parse_traceparent(" " + header)
+        self.assertEqual(fast.trace_flags, 0x03)
+        self.assertEqual(slow.trace_flags, fast.trace_flags)
+
     def test_inject_extract_traceparent(self):
         """Test injecting and extracting traceparent."""
         ctx = SpanContext(
@@ -150,6 +259,23 @@ class TestPropagation(unittest.TestCase):
         self.assertEqual(extracted.trace_id, ctx.trace_id)
         self.assertEqual(extracted.span_id, ctx.span_id)
     
+    def test_inject_extract_tracestate(self):
+        """Test that tracestate round-trips through headers unchanged."""
+        ctx = SpanContext(
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            trace_flags=1,
+            trace_state="tenant=test,project=proj",
+        )
+        
+        headers = {}
+        inject_traceparent(headers, ctx)
+        inject_tracestate(headers, ctx)
+        self.assertEqual(headers["tracestate"], "tenant=test,project=proj")
+        
+        extracted = extract_trace_context(headers)
+        self.assertEqual(extracted, ctx)
+    
     def test_tracestate_format_parse(self):
         """Test formatting and parsing tracestate."""
         state = {"tenant": "test", "project": "proj", "dbg": "1"}
@@ -192,10 +318,8 @@ class TestExporters(unittest.TestCase):
         span.set_attribute("key", "value")
         span.end()
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
-            temp_path = f.name
-        
-        try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            temp_path = os.path.join(tmpdir, "traces.jsonl")
             exporter = FileExporter(file_path=temp_path, reset_on_start=True)
             result = exporter.export([span])
             self.assertTrue(result)
@@ -204,9 +328,6 @@ class TestExporters(unittest.TestCase):
             with open(temp_path, 'r') as f:
                 content = f.read()
                 self.assertIn("test_span", content)
-        finally:
-            import os
-            os.unlink(temp_path)
     
     def test_http_exporter_creation(self):
         """Test HttpExporter creation."""
@@ -247,6 +368,73 @@ class TestProcessors(unittest.TestCase):
         # Check if token counts were added (processor runs before end)
         # Note: This is a best-effort check since processor runs asynchronously
         self.assertIsNotNone(span.attributes)
+    
+    def test_batch_processor_counts_dropped_spans(self):
+        """Test that queue overflow is reported in the batch processor stats."""
+        from traccia.processors.batch_processor import BatchSpanProcessor
+        
+        processor = BatchSpanProcessor(max_queue_size=2, schedule_delay_millis=60000)
+        try:
+            for i in range(5):
+                processor.on_end(self.tracer.start_span(f"span_{i}"))
+            stats = processor.get_stats()
+            self.assertEqual(stats["queued_spans"], 2)
+            self.assertEqual(stats["dropped_spans"], 3)
+        finally:
+            processor.shutdown()
+
+    def test_batch_processor_drain_waits_for_locked_producers(self):
+        """Test that draining a locked-policy queue waits on the producer lock."""
+        import threading
+        from traccia.processors.batch_processor import BatchSpanProcessor
+        from traccia.processors.drop_policy import DropNewestPolicy
+
+        processor = BatchSpanProcessor(
+            max_queue_size=4, schedule_delay_millis=60000, drop_policy=DropNewestPolicy()
+        )
+        try:
+            processor.on_end(self.tracer.start_span("queued"))
+            drained = []
+            with processor._lock:
+                # A drop policy runs under _lock and may shrink the queue here
+                drain = threading.Thread(target=lambda: drained.extend(processor._drain_queue(10)))
+                drain.start()
+                drain.join(timeout=0.05)
+                self.assertTrue(drain.is_alive())
+                processor._queue.clear()
+            drain.join()
+            self.assertEqual(drained, [])
+        finally:
+            processor.shutdown()
+
+
+class TestOpenAIInstrumentation(unittest.TestCase):
+    """Test OpenAI request serialization."""
+
+    MESSAGES = [{"role": "user", "content": "héllo"}, {"role": "assistant", "content": "hi"}]
+    EXPECTED = '[{"role":"user","content":"héllo"},{"role":"assistant","content":"hi"}]'
+
+    def test_json_dumps_truncated_exact_output(self):
+        """Test the exact serialized messages string, with and without orjson."""
+        import importlib.util
+        import sys
+        from unittest import mock
+        from traccia.instrumentation import openai as openai_instrumentation
+
+        self.assertEqual(openai_instrumentation._json_dumps_truncated(self.MESSAGES), self.EXPECTED)
+        self.assertEqual(
+            openai_instrumentation._json_dumps_truncated(self.MESSAGES, limit=20), self.EXPECTED[:20]
+        )
+
+        # Load a private copy with orjson hidden to exercise the stdlib fallback
+        spec = importlib.util.spec_from_file_location(
+            "_traccia_openai_stdlib_json", openai_instrumentation.__file__
+        )
+        fallback = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            spec.loader.exec_module(fallback)
+        self.assertIsNone(fallback.orjson)
+        self.assertEqual(fallback._json_dumps_truncated(self.MESSAGES), self.EXPECTED)
 
 
 if __name__ == "__main__":
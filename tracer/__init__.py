@@ -1,9 +1,24 @@
 """Tracer components for the tracing SDK."""
 
-from traccia.tracer.provider import SpanProcessor, TracerProvider
-from traccia.tracer.span import Span, SpanStatus
-from traccia.tracer.span_context import SpanContext
-from traccia.tracer.tracer import Tracer
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from traccia.tracer.provider import SpanProcessor, TracerProvider
+    from traccia.tracer.span import Span, SpanStatus
+    from traccia.tracer.span_context import SpanContext
+    from traccia.tracer.tracer import Tracer
+
+# Submodules are resolved on first access (PEP 562), so importing one symbol
+# (e.g. SpanContext) doesn't pull in the OTel SDK through the others.
+_LAZY_IMPORTS = {
+    "Span": "traccia.tracer.span",
+    "SpanStatus": "traccia.tracer.span",
+    "SpanContext": "traccia.tracer.span_context",
+    "Tracer": "traccia.tracer.tracer",
+    "TracerProvider": "traccia.tracer.provider",
+    "SpanProcessor": "traccia.tracer.provider",
+}
 
 __all__ = [
     "Span",
@@ -13,3 +28,17 @@ __all__ = [
     "TracerProvider",
     "SpanProcessor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
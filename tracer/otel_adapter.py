@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+import threading
 import time
 import traceback
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from collections.abc import Mapping as _MappingABC
+from random import getrandbits
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, TYPE_CHECKING
 
 from opentelemetry import trace as otel_trace_api
 from opentelemetry.sdk.trace import TracerProvider as OTelTracerProvider
 from opentelemetry.sdk.trace import ReadableSpan
 from opentelemetry.sdk.resources import Resource as OTelResource
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
 from opentelemetry.trace import Status as OTelStatus, StatusCode as OTelStatusCode
-from opentelemetry.trace import SpanContext as OTelSpanContext
+from opentelemetry.trace import SpanContext as OTelSpanContext, TraceFlags, TraceState
 from opentelemetry.trace import Span as OTelSpan, NonRecordingSpan
 
+from traccia import runtime_config
+from traccia.context.context import get_current_span, pop_span, push_span
+from traccia.context.propagators import (
+    _parse_tracestate_items,
+    format_tracestate,
+    parse_tracestate,
+)
 from traccia.tracer.otel_utils import (
     otel_trace_id_to_traccia,
     otel_span_id_to_traccia,
@@ -28,8 +41,71 @@ if TYPE_CHECKING:
     from traccia.tracer.tracer import Tracer as TracciaTracer
 
 
+# Marks a lazily computed field that hasn't been computed yet
+_UNSET: Any = object()
+
+# Shared immutable empties; spans swap in a real dict/list on first write
+_EMPTY_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_EVENTS: Tuple[()] = ()
+_EMPTY_TRACESTATE = TraceState()
+
+# Traccia contexts only carry the sampled bit, so both flag values are prebuilt
+_TRACE_FLAGS = (TraceFlags(0), TraceFlags(1))
+
+
+class _ExceptionEventAttributes(_MappingABC):
+    """
+    Attributes of a locally recorded exception event.
+    
+    The stacktrace is taken from the matching OTel exception event when
+    there is one; otherwise it is only formatted when looked up (i.e. when
+    the span's events are read). Either way the result is cached.
+    """
+    
+    __slots__ = ("_error", "_stacktrace", "_items")
+    
+    _KEYS = ("exception.type", "exception.message", "exception.stacktrace")
+    
+    def __init__(self, error: BaseException, stacktrace: Optional[str] = None):
+        self._error = error
+        self._stacktrace = stacktrace
+        self._items: Optional[Dict[str, str]] = None
+    
+    def _materialize(self) -> Dict[str, str]:
+        items = self._items
+        if items is None:
+            error = self._error
+            stacktrace = self._stacktrace
+            if stacktrace is None:
+                stacktrace = "".join(
+                    traceback.format_exception(error.__class__, error, error.__traceback__)
+                )
+            items = self._items = {
+                "exception.type": error.__class__.__name__,
+                "exception.message": str(error),
+                "exception.stacktrace": stacktrace,
+            }
+        return items
+    
+    def __getitem__(self, key: str) -> str:
+        return self._materialize()[key]
+    
+    def __iter__(self):
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
 class TracciaSpanContextAdapter:
-    """Adapter wrapping OpenTelemetry SpanContext to match Traccia SpanContext API."""
+    """
+    Adapter wrapping OpenTelemetry SpanContext to match Traccia SpanContext API.
+    
+    The hex IDs and the W3C tracestate string are derived on first access,
+    since most spans never have them read.
+    """
+    
+    __slots__ = ("_otel_context", "_trace_id", "_span_id", "_trace_state", "trace_flags")
     
     def __init__(self, otel_context: OTelSpanContext):
         """
@@ -39,20 +115,46 @@ class TracciaSpanContextAdapter:
             otel_context: OpenTelemetry SpanContext instance
         """
         self._otel_context = otel_context
-        # Convert int IDs to hex strings for Traccia compatibility
-        self.trace_id = otel_trace_id_to_traccia(otel_context.trace_id)
-        self.span_id = otel_span_id_to_traccia(otel_context.span_id)
-        self.trace_flags = otel_context.trace_flags.sampled if hasattr(otel_context.trace_flags, 'sampled') else (1 if otel_context.is_valid else 0)
-        # Convert TraceState to string
-        trace_state = otel_context.trace_state
-        if trace_state:
-            # Convert OTel TraceState to W3C format string
-            items = []
-            for key, value in trace_state.items():
-                items.append(f"{key}={value}")
-            self.trace_state = ",".join(items) if items else None
-        else:
-            self.trace_state = None
+        self._trace_id = _UNSET
+        self._span_id = _UNSET
+        self._trace_state = _UNSET
+        try:
+            self.trace_flags = otel_context.trace_flags.sampled
+        except AttributeError:
+            self.trace_flags = 1 if otel_context.is_valid else 0
+    
+    @property
+    def trace_id(self) -> str:
+        trace_id = self._trace_id
+        if trace_id is _UNSET:
+            # Convert int IDs to hex strings for Traccia compatibility
+            trace_id = self._trace_id = otel_trace_id_to_traccia(self._otel_context.trace_id)
+        return trace_id
+    
+    @property
+    def span_id(self) -> str:
+        span_id = self._span_id
+        if span_id is _UNSET:
+            span_id = self._span_id = otel_span_id_to_traccia(self._otel_context.span_id)
+        return span_id
+    
+    @property
+    def trace_state(self) -> Optional[str]:
+        trace_state = self._trace_state
+        if trace_state is _UNSET:
+            # Convert OTel TraceState to W3C format string. A non-empty
+            # TraceState always yields a non-empty header, and join() over a
+            # list beats a generator (join materializes its input anyway)
+            otel_trace_state = self._otel_context.trace_state
+            trace_state = None
+            if otel_trace_state:
+                trace_state = ",".join([f"{key}={value}" for key, value in otel_trace_state.items()])
+            self._trace_state = trace_state
+        return trace_state
+    
+    @trace_state.setter
+    def trace_state(self, value: Optional[str]) -> None:
+        self._trace_state = value
     
     def is_valid(self) -> bool:
         """Check if the span context is valid."""
@@ -69,36 +171,65 @@ class TracciaSpanContextAdapter:
         Returns:
             OpenTelemetry SpanContext
         """
-        from opentelemetry.trace import TraceFlags, TraceState
-        
-        trace_id = traccia_id_to_otel_trace_id(traccia_context.trace_id)
-        span_id = traccia_id_to_otel_span_id(traccia_context.span_id)
-        trace_flags = TraceFlags(traccia_context.trace_flags)
-        
-        # Parse trace_state string to OTel TraceState
-        trace_state = None
-        if traccia_context.trace_state:
-            # Parse W3C format: key1=value1,key2=value2
-            items = []
-            for pair in traccia_context.trace_state.split(','):
-                if '=' in pair:
-                    key, value = pair.split('=', 1)
-                    items.append((key.strip(), value.strip()))
-            if items:
-                trace_state = TraceState(items)
-        
-        return OTelSpanContext(
-            trace_id=trace_id,
-            span_id=span_id,
-            is_remote=False,
-            trace_flags=trace_flags,
-            trace_state=trace_state or TraceState(),
+        return _otel_context_from_fields(
+            traccia_context.trace_id,
+            traccia_context.span_id,
+            traccia_context.trace_flags & 1,
+            traccia_context.trace_state,
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _otel_context_from_fields(
+    trace_id: str, span_id: str, sampled: int, trace_state: Optional[str]
+) -> OTelSpanContext:
+    """
+    Build the OTel SpanContext for from_traccia().
+    
+    OTel contexts are immutable, so children started under the same parent
+    share one instance instead of re-converting the IDs and tracestate.
+    """
+    # Parse trace_state string to OTel TraceState; the W3C parse is
+    # cached per header value in the propagators module
+    otel_trace_state = _EMPTY_TRACESTATE
+    if trace_state:
+        items = _parse_tracestate_items(trace_state)
+        if items:
+            otel_trace_state = TraceState(list(items))
+    
+    return OTelSpanContext(
+        trace_id=traccia_id_to_otel_trace_id(trace_id),
+        span_id=traccia_id_to_otel_span_id(span_id),
+        is_remote=False,
+        trace_flags=_TRACE_FLAGS[sampled],
+        trace_state=otel_trace_state,
+    )
+
+
 class TracciaSpanAdapter:
     """Adapter wrapping OpenTelemetry Span to match Traccia Span API."""
     
+    __slots__ = (
+        "_otel_span",
+        "tracer",
+        "parent_span_id",
+        "context",
+        "name",
+        "attributes",
+        "_owns_attributes",
+        "_initial_events",
+        "_event_tuples",
+        "status",
+        "status_description",
+        "start_time_ns",
+        "end_time_ns",
+        "_start_monotonic_ns",
+        "_activation_tokens",
+        "_ended",
+        # Set by BatchSpanProcessor once the span is queued for export
+        "_batch_queued",
+    )
+    
     def __init__(
         self,
         otel_span: OTelSpan,
@@ -121,64 +252,70 @@ class TracciaSpanAdapter:
         otel_context = otel_span.get_span_context()
         self.context = TracciaSpanContextAdapter(otel_context)
         
-        # Get name
+        # Attributes are copy-on-write: reads go straight to the OTel span's
+        # attributes (or the shared empty mapping) until the first
+        # set_attribute() takes a private copy
+        self.attributes: Mapping[str, Any] = _EMPTY_ATTRIBUTES
+        self._owns_attributes = False
+        
+        # Events are only turned into dicts when the events property is read:
+        # the OTel span's existing events are referenced as-is and
+        # add_event() records (name, attributes, timestamp_ns) tuples
+        self._initial_events: Sequence[Any] = _EMPTY_EVENTS
+        self._event_tuples: Union[List[Tuple[str, Any, int]], Tuple[()]] = _EMPTY_EVENTS
+        
+        # Copy name, attributes, events, status and timestamps from the OTel
+        # span in one pass
         if isinstance(otel_span, ReadableSpan):
             self.name = otel_span.name
+            
+            attributes = otel_span.attributes
+            if attributes:
+                self.attributes = attributes
+            events = otel_span.events
+            if events:
+                self._initial_events = events
+            
+            otel_status = otel_span.status
+            self.status = self._convert_status(otel_status)
+            self.status_description = otel_status.description if otel_status else None
+            
+            self.start_time_ns = otel_span.start_time or time.time_ns()
+            self.end_time_ns = otel_span.end_time or None
         else:
             # For non-readable spans, we need to track name separately
             self.name = getattr(otel_span, '_traccia_name', 'unknown')
-        
-        # Initialize attributes dict - will be kept in sync with OTel span
-        self.attributes: Dict[str, Any] = {}
-        if isinstance(otel_span, ReadableSpan):
-            if otel_span.attributes:
-                self.attributes = dict(otel_span.attributes)
-        
-        # Initialize events list - will be kept in sync
-        self.events: List[Dict[str, Any]] = []
-        if isinstance(otel_span, ReadableSpan):
-            if otel_span.events:
-                for event in otel_span.events:
-                    self.events.append({
-                        "name": event.name,
-                        "attributes": dict(event.attributes) if event.attributes else {},
-                        "timestamp_ns": event.timestamp,
-                    })
-        
-        # Convert status
-        if isinstance(otel_span, ReadableSpan):
-            self.status = self._convert_status(otel_span.status)
-            self.status_description = otel_span.status.description if otel_span.status else None
-        else:
             self.status = TracciaSpanStatus.UNSET
             self.status_description = None
-        
-        # Get timestamps
-        if isinstance(otel_span, ReadableSpan):
-            self.start_time_ns = otel_span.start_time if otel_span.start_time else time.time_ns()
-            self.end_time_ns = otel_span.end_time if otel_span.end_time else None
-        else:
             self.start_time_ns = time.time_ns()
             self.end_time_ns = None
+        # end() derives the end timestamp from elapsed monotonic time, so
+        # durations are immune to wall-clock jumps
+        self._start_monotonic_ns = time.monotonic_ns()
         
         self._activation_tokens: Optional[Tuple] = None
         self._ended = False
+        self._batch_queued = False
         
         # Apply tracestate enrichment (matching Traccia behavior)
         self._enrich_tracestate()
     
     def _enrich_tracestate(self) -> None:
         """Enrich tracestate with runtime metadata (tenant, project, debug)."""
+        tenant_id = runtime_config.get_tenant_id()
+        project_id = runtime_config.get_project_id()
+        debug = runtime_config.get_debug()
+        if not (tenant_id or project_id or debug):
+            # Nothing to add, so leave the tracestate unparsed
+            return
+        
         try:
-            from traccia.context.propagators import format_tracestate, parse_tracestate
-            from traccia import runtime_config
-            
             base = parse_tracestate(self.context.trace_state or "")
-            if runtime_config.get_tenant_id():
-                base.setdefault("tenant", runtime_config.get_tenant_id())
-            if runtime_config.get_project_id():
-                base.setdefault("project", runtime_config.get_project_id())
-            if runtime_config.get_debug():
+            if tenant_id:
+                base.setdefault("tenant", tenant_id)
+            if project_id:
+                base.setdefault("project", project_id)
+            if debug:
                 base.setdefault("dbg", "1")
             
             ts = format_tracestate(base)
@@ -218,6 +355,27 @@ class TracciaSpanAdapter:
             return None
         return self.end_time_ns - self.start_time_ns
     
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Events recorded on the span, as a freshly built list of dicts."""
+        events = [
+            {
+                "name": event.name,
+                "attributes": dict(event.attributes) if event.attributes else {},
+                "timestamp_ns": event.timestamp,
+            }
+            for event in self._initial_events
+        ]
+        events.extend(
+            {
+                "name": name,
+                "attributes": dict(attributes) if attributes else {},
+                "timestamp_ns": timestamp_ns,
+            }
+            for name, attributes, timestamp_ns in self._event_tuples
+        )
+        return events
+    
     def set_attribute(self, key: str, value: Any) -> None:
         """Set an attribute on the span."""
         # Only set on OTel span if it's not ended
@@ -229,6 +387,9 @@ class TracciaSpanAdapter:
         except Exception:
             # Span may be ended, just update local dict
             pass
+        if not self._owns_attributes:
+            self.attributes = dict(self.attributes)
+            self._owns_attributes = True
         self.attributes[key] = value
     
     def add_event(
@@ -238,12 +399,9 @@ class TracciaSpanAdapter:
         timestamp_ns: Optional[int] = None,
     ) -> None:
         """Add an event to the span."""
-        event_dict = {
-            "name": name,
-            "attributes": dict(attributes) if attributes else {},
-            "timestamp_ns": timestamp_ns or time.time_ns(),
-        }
-        self.events.append(event_dict)
+        if self._event_tuples is _EMPTY_EVENTS:
+            self._event_tuples = []
+        self._event_tuples.append((name, attributes or None, timestamp_ns or time.time_ns()))
         
         # Add to OTel span
         self._otel_span.add_event(
@@ -254,21 +412,34 @@ class TracciaSpanAdapter:
     
     def record_exception(self, error: BaseException) -> None:
         """Record an exception event on the span."""
-        # Add to Traccia events list
-        self.add_event(
-            "exception",
-            {
-                "exception.type": error.__class__.__name__,
-                "exception.message": str(error),
-                "exception.stacktrace": "".join(
-                    traceback.format_exception(error.__class__, error, error.__traceback__)
-                ),
-            },
+        # Record on OTel span first: it formats the stacktrace into its own
+        # exception event, which the Traccia event below reuses
+        otel_span = self._otel_span
+        # An ended OTel span drops the event, so only a live one is inspected
+        recording = otel_span.is_recording()
+        otel_span.record_exception(error)
+        
+        stacktrace = None
+        timestamp_ns = None
+        if recording and isinstance(otel_span, ReadableSpan):
+            otel_events = otel_span.events
+            if otel_events and otel_events[-1].name == "exception":
+                otel_event = otel_events[-1]
+                stacktrace = otel_event.attributes.get("exception.stacktrace")
+                timestamp_ns = otel_event.timestamp
+        
+        # Add to Traccia events list; without an OTel event (e.g. the span
+        # already ended) the stacktrace is formatted on first read
+        if self._event_tuples is _EMPTY_EVENTS:
+            self._event_tuples = []
+        self._event_tuples.append(
+            (
+                "exception",
+                _ExceptionEventAttributes(error, stacktrace),
+                timestamp_ns or time.time_ns(),
+            )
         )
         
-        # Record on OTel span
-        self._otel_span.record_exception(error)
-        
         # Set error status
         self.set_status(TracciaSpanStatus.ERROR, str(error))
     
@@ -286,7 +457,7 @@ class TracciaSpanAdapter:
         if self._ended:
             return
         
-        self.end_time_ns = time.time_ns()
+        self.end_time_ns = self.start_time_ns + (time.monotonic_ns() - self._start_monotonic_ns)
         if self.status == TracciaSpanStatus.UNSET:
             self.status = TracciaSpanStatus.OK
         
@@ -333,9 +504,103 @@ class TracciaSpanAdapter:
         return False
 
 
+class _NonRecordingSpanAdapter(TracciaSpanAdapter):
+    """
+    Adapter for spans the sampler dropped (OTel NonRecordingSpan).
+    
+    Only the context, name and timing are kept: attributes and events are
+    shared empty read-only containers, mutators are no-ops, and tracestate
+    enrichment is skipped since nothing will be exported.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(
+        self,
+        otel_span: OTelSpan,
+        tracer: "TracciaTracerAdapter",
+        parent_span_id: Optional[str] = None,
+        name: str = "unknown",
+    ):
+        self._otel_span = otel_span
+        self.tracer = tracer
+        self.parent_span_id = parent_span_id
+        self.context = TracciaSpanContextAdapter(otel_span.get_span_context())
+        self.name = name
+        self.attributes = _EMPTY_ATTRIBUTES
+        self._owns_attributes = False
+        self._initial_events = _EMPTY_EVENTS
+        self._event_tuples = _EMPTY_EVENTS
+        self.status = TracciaSpanStatus.UNSET
+        self.status_description = None
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self._start_monotonic_ns = time.monotonic_ns()
+        self._activation_tokens = None
+        self._ended = False
+        self._batch_queued = False
+    
+    def set_attribute(self, key: str, value: Any) -> None:
+        """No-op: the span is not recorded."""
+    
+    def add_event(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        timestamp_ns: Optional[int] = None,
+    ) -> None:
+        """No-op: the span is not recorded."""
+    
+    def record_exception(self, error: BaseException) -> None:
+        """Only the status is kept; the exception event would be discarded."""
+        self.set_status(TracciaSpanStatus.ERROR, str(error))
+
+
+class _NoopSpanAdapter(_NonRecordingSpanAdapter):
+    """
+    Shared span handed out when the OTel sampler is ALWAYS_OFF.
+    
+    Nothing about a span can be recorded or propagated in that mode, so a
+    single instance with an invalid context serves every start_span() call:
+    every mutator is a no-op and entering it does not make it current, since
+    activation tokens can't be kept on a shared object.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self):
+        super().__init__(NonRecordingSpan(otel_trace_api.INVALID_SPAN_CONTEXT), None, name="")
+    
+    def record_exception(self, error: BaseException) -> None:
+        """No-op: the span is not recorded."""
+    
+    def set_status(self, status: TracciaSpanStatus, description: Optional[str] = None) -> None:
+        """No-op: the span is not recorded."""
+    
+    def end(self) -> None:
+        """No-op: the span is not recorded."""
+    
+    def __enter__(self) -> "_NoopSpanAdapter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+    
+    async def __aenter__(self) -> "_NoopSpanAdapter":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpanAdapter()
+
+
 class TracciaTracerAdapter:
     """Adapter wrapping OpenTelemetry Tracer to match Traccia Tracer API."""
     
+    __slots__ = ("_otel_tracer", "_provider", "instrumentation_scope")
+    
     def __init__(self, otel_tracer: otel_trace_api.Tracer, provider: "TracciaTracerProviderAdapter", instrumentation_scope: str):
         """
         Initialize adapter with OpenTelemetry Tracer.
@@ -368,10 +633,17 @@ class TracciaTracerAdapter:
         Returns:
             TracciaSpanAdapter wrapping the new OTel span
         """
-        from traccia.context import context as span_context
+        if (
+            not self._provider._sampling_enabled
+            and parent is None
+            and parent_context is None
+        ):
+            # Every span will be dropped and there is no parent whose trace
+            # could be continued, so skip OTel and the adapter entirely
+            return _NOOP_SPAN
         
         # Determine parent
-        parent_span = parent or span_context.get_current_span()
+        parent_span = parent or get_current_span()
         
         # Convert parent context if provided
         otel_parent_context = None
@@ -403,6 +675,10 @@ class TracciaTracerAdapter:
             context=otel_parent_context,
         )
         
+        # Dropped by the sampler: skip the attribute/event/tracestate work
+        if not otel_span.is_recording():
+            return _NonRecordingSpanAdapter(otel_span, self, parent_span_id, name)
+        
         # Store name for non-readable spans
         if not isinstance(otel_span, ReadableSpan):
             otel_span._traccia_name = name
@@ -438,18 +714,15 @@ class TracciaTracerAdapter:
     
     def get_current_span(self) -> Optional["TracciaSpanAdapter"]:
         """Get the current span."""
-        from traccia.context import context as span_context
-        return span_context.get_current_span()
+        return get_current_span()
     
     def _activate_span(self, span: "TracciaSpanAdapter"):
         """Activate a span (set as current)."""
-        from traccia.context import context as span_context
-        return span_context.push_span(span)
+        return push_span(span)
     
     def _deactivate_span(self, tokens) -> None:
         """Deactivate a span (restore previous)."""
-        from traccia.context import context as span_context
-        span_context.pop_span(tokens)
+        pop_span(tokens)
     
     def _on_span_end(self, span: "TracciaSpanAdapter") -> None:
         """Called when a span ends."""
@@ -459,6 +732,16 @@ class TracciaTracerAdapter:
 class TracciaTracerProviderAdapter:
     """Adapter wrapping OpenTelemetry TracerProvider to match Traccia TracerProvider API."""
     
+    __slots__ = (
+        "_otel_provider",
+        "_sampling_enabled",
+        "resource",
+        "_tracers",
+        "_span_processors",
+        "_lock",
+        "sampler",
+    )
+    
     def __init__(self, resource: Optional[Dict[str, str]] = None):
         """
         Initialize adapter with OpenTelemetry TracerProvider.
@@ -469,13 +752,17 @@ class TracciaTracerProviderAdapter:
         # Convert resource dict to OTel Resource
         otel_resource = OTelResource.create(resource or {})
         self._otel_provider = OTelTracerProvider(resource=otel_resource)
+        # The OTel sampler is fixed at creation (e.g. OTEL_TRACES_SAMPLER=always_off)
+        self._sampling_enabled = self._otel_provider.sampler is not ALWAYS_OFF
         
         # Store resource as dict for Traccia compatibility
         self.resource = resource or {}
         
         # Tracers cache
         self._tracers: Dict[str, TracciaTracerAdapter] = {}
-        self._span_processors: List[Any] = []
+        # Replaced (not mutated) on add, so span-end iteration needs no copy
+        self._span_processors: Tuple[Any, ...] = ()
+        self._lock = threading.Lock()
         self.sampler: Optional[Any] = None
     
     def get_tracer(self, name: str) -> TracciaTracerAdapter:
@@ -488,16 +775,18 @@ class TracciaTracerProviderAdapter:
         Returns:
             TracciaTracerAdapter wrapping OTel Tracer
         """
-        if name in self._tracers:
-            return self._tracers[name]
-        
-        # Get OTel tracer
-        otel_tracer = self._otel_provider.get_tracer(name)
-        
-        # Wrap in adapter
-        tracer = TracciaTracerAdapter(otel_tracer, self, name)
-        self._tracers[name] = tracer
-        return tracer
+        tracer = self._tracers.get(name)
+        if tracer is not None:
+            return tracer
+        
+        with self._lock:
+            tracer = self._tracers.get(name)
+            if tracer is None:
+                # Wrap the OTel tracer in an adapter
+                otel_tracer = self._otel_provider.get_tracer(name)
+                tracer = TracciaTracerAdapter(otel_tracer, self, name)
+                self._tracers[name] = tracer
+            return tracer
     
     def add_span_processor(self, processor: Any) -> None:
         """
@@ -506,7 +795,8 @@ class TracciaTracerProviderAdapter:
         Args:
             processor: Traccia SpanProcessor instance
         """
-        self._span_processors.append(processor)
+        with self._lock:
+            self._span_processors = self._span_processors + (processor,)
         
         # If processor has OTel compatibility, add to OTel provider
         # For now, we'll handle Traccia processors via _notify_span_end
@@ -533,7 +823,7 @@ class TracciaTracerProviderAdapter:
         Args:
             span: The span that ended
         """
-        for processor in list(self._span_processors):
+        for processor in self._span_processors:
             try:
                 processor.on_end(span)
             except Exception:
@@ -546,7 +836,7 @@ class TracciaTracerProviderAdapter:
         self._otel_provider.force_flush(timeout_millis=int(timeout * 1000) if timeout else 30000)
         
         # Flush Traccia processors
-        for processor in list(self._span_processors):
+        for processor in self._span_processors:
             try:
                 processor.force_flush(timeout=timeout)
             except Exception:
@@ -558,7 +848,7 @@ class TracciaTracerProviderAdapter:
         self._otel_provider.shutdown()
         
         # Shutdown Traccia processors
-        for processor in list(self._span_processors):
+        for processor in self._span_processors:
             try:
                 processor.shutdown()
             except Exception:
@@ -567,11 +857,16 @@ class TracciaTracerProviderAdapter:
     @staticmethod
     def generate_trace_id() -> str:
         """Generate a new trace ID in Traccia format (hex string)."""
-        import secrets
-        return secrets.token_hex(16)
+        # Same source as OTel's RandomIdGenerator; all-zero IDs are invalid
+        trace_id = getrandbits(128)
+        while trace_id == 0:
+            trace_id = getrandbits(128)
+        return "%032x" % trace_id
     
     @staticmethod
     def generate_span_id() -> str:
         """Generate a new span ID in Traccia format (hex string)."""
-        import secrets
-        return secrets.token_hex(8)
+        span_id = getrandbits(64)
+        while span_id == 0:
+            span_id = getrandbits(64)
+        return "%016x" % span_id
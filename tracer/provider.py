@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from opentelemetry.sdk.trace import TracerProvider as OTelTracerProvider
 from opentelemetry.sdk.trace import SpanProcessor as OTelSpanProcessor
@@ -60,8 +60,10 @@ class TracerProvider:
         # Store resource as dict for backward compatibility
         self.resource = resource or {}
         
-        # Separate enrichment vs export processors
-        self._enrichment_processors: List[SpanProcessor] = []  # Traccia processors
+        # Separate enrichment vs export processors. Enrichment processors run
+        # on every span end, so they are held as a tuple that add_span_processor()
+        # replaces; readers iterate it without copying or locking.
+        self._enrichment_processors: Tuple[SpanProcessor, ...] = ()  # Traccia processors
         self._export_processors: List[OTelSpanProcessor] = []   # OTel processors
         
         # Tracers cache
@@ -81,6 +83,11 @@ class TracerProvider:
         Returns:
             Traccia Tracer instance (wraps OTel Tracer)
         """
+        # Dict reads are atomic, so cache hits skip the lock; it only
+        # serializes creation so each name maps to a single Tracer
+        tracer = self._tracers.get(name)
+        if tracer is not None:
+            return tracer
         with self._lock:
             tracer = self._tracers.get(name)
             if tracer is None:
@@ -104,7 +111,8 @@ class TracerProvider:
             self._export_processors.append(processor)
         else:
             # Traccia enrichment processor
-            self._enrichment_processors.append(processor)
+            with self._lock:
+                self._enrichment_processors = self._enrichment_processors + (processor,)
 
     def set_sampler(self, sampler: Any) -> None:
         """
@@ -2,19 +2,63 @@
 
 from __future__ import annotations
 
+import functools
 import time
-import traceback
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from opentelemetry.trace import Span as OTelSpan, Status, StatusCode
-from opentelemetry.trace import set_span_in_context
-from opentelemetry import context as context_api
+
+from traccia import runtime_config
+from traccia.context.context import pop_span, push_span
+from traccia.context.propagators import format_tracestate, parse_tracestate
+from traccia.tracer.span_context import SpanContext
+from traccia.utils.helpers import format_span_id, format_trace_id
 
 if TYPE_CHECKING:
     from traccia.tracer.tracer import Tracer
 
 
+def _enrich_tracestate(trace_state: Optional[str]) -> Optional[str]:
+    """Add runtime metadata (tenant, project, debug) to a tracestate string."""
+    tenant_id = runtime_config.get_tenant_id()
+    project_id = runtime_config.get_project_id()
+    debug = runtime_config.get_debug()
+    if not (tenant_id or project_id or debug or trace_state):
+        # Common case: nothing to add and nothing to normalize
+        return trace_state
+    return _enriched_tracestate(trace_state, tenant_id, project_id, bool(debug))
+
+
+@functools.lru_cache(maxsize=256)
+def _enriched_tracestate(
+    trace_state: Optional[str],
+    tenant_id: Optional[str],
+    project_id: Optional[str],
+    debug: bool,
+) -> Optional[str]:
+    """Parse, enrich and re-format a tracestate; cached since inputs repeat per trace."""
+    try:
+        base = parse_tracestate(trace_state or "")
+        if tenant_id:
+            base.setdefault("tenant", tenant_id)
+        if project_id:
+            base.setdefault("project", project_id)
+        if debug:
+            base.setdefault("dbg", "1")
+        return format_tracestate(base) or trace_state
+    except Exception:
+        return trace_state
+
+
+# Marks an attribute key that hasn't been set locally
+_MISSING: Any = object()
+_SCALAR_TYPES = frozenset((str, bool, int, float))
+
+# Last (TraceState, header) pair formatted by Span._format_trace_state
+_TRACE_STATE_CACHE: Optional[Tuple[Any, str]] = None
+
+
 class SpanStatus(Enum):
     UNSET = 0
     OK = 1
@@ -28,6 +72,24 @@ class Span:
     Provides Traccia API compatibility while using OTel span internally.
     """
 
+    # One wrapper is created per span, so skip the per-instance __dict__
+    __slots__ = (
+        "_otel_span",
+        "tracer",
+        "parent_span_id",
+        "_ended",
+        "_activation_token",
+        "context",
+        "name",
+        "start_time_ns",
+        "end_time_ns",
+        "status",
+        "status_description",
+        "_attributes",
+        # Set by BatchSpanProcessor once the span is queued for export
+        "_batch_queued",
+    )
+
     def __init__(
         self,
         otel_span: OTelSpan,
@@ -47,28 +109,26 @@ class Span:
         self.parent_span_id = parent_span_id
         self._ended = False
         self._activation_token = None
+        self._batch_queued = False
         
         # Store tracer reference on OTel span for context retrieval
         otel_span._traccia_tracer = tracer
         
         # Create Traccia-compatible properties
-        from traccia.tracer.span_context import SpanContext
-        from traccia.utils.helpers import format_trace_id, format_span_id
-        
         otel_context = otel_span.get_span_context()
         self.context = SpanContext(
             trace_id=format_trace_id(otel_context.trace_id),
             span_id=format_span_id(otel_context.span_id),
             trace_flags=1 if otel_context.trace_flags.sampled else 0,
-            trace_state=self._format_trace_state(otel_context.trace_state),
+            # Enriched with runtime metadata before the (frozen) context is built
+            trace_state=_enrich_tracestate(self._format_trace_state(otel_context.trace_state)),
         )
         
-        # Enrich tracestate with runtime metadata
-        self._enrich_tracestate()
-        
         # Expose span properties for processor access
         self.name = getattr(otel_span, 'name', 'unknown')
-        self.start_time_ns = time.time_ns()
+        # Reuse the timestamp OTel took when starting the span; only spans
+        # without one (e.g. NonRecordingSpan) read the clock here
+        self.start_time_ns: int = getattr(otel_span, 'start_time', None) or time.time_ns()
         self.end_time_ns: Optional[int] = None
         
         # Status
@@ -77,42 +137,22 @@ class Span:
         
         # Maintain attribute dict for easy access
         # This mirrors OTel span attributes
-        self._attributes: Dict[str, Any] = {}
+        # Allocated on first write or read, since many spans never get any
+        self._attributes: Optional[Dict[str, Any]] = None
 
     def _format_trace_state(self, trace_state) -> Optional[str]:
         """Format OTel TraceState to W3C string format."""
+        global _TRACE_STATE_CACHE
         if not trace_state:
             return None
-        items = []
-        for key, value in trace_state.items():
-            items.append(f"{key}={value}")
-        return ",".join(items) if items else None
-
-    def _enrich_tracestate(self) -> None:
-        """Enrich tracestate with runtime metadata."""
-        try:
-            from traccia.context.propagators import format_tracestate, parse_tracestate
-            from traccia import runtime_config
-            
-            base = parse_tracestate(self.context.trace_state or "")
-            if runtime_config.get_tenant_id():
-                base.setdefault("tenant", runtime_config.get_tenant_id())
-            if runtime_config.get_project_id():
-                base.setdefault("project", runtime_config.get_project_id())
-            if runtime_config.get_debug():
-                base.setdefault("dbg", "1")
-            
-            ts = format_tracestate(base)
-            if ts:
-                from traccia.tracer.span_context import SpanContext
-                self.context = SpanContext(
-                    trace_id=self.context.trace_id,
-                    span_id=self.context.span_id,
-                    trace_flags=self.context.trace_flags,
-                    trace_state=ts,
-                )
-        except Exception:
-            pass
+        # OTel hands the parent's (immutable) TraceState to every child span,
+        # so the last formatted object is usually the one being asked for
+        cached = _TRACE_STATE_CACHE
+        if cached is not None and cached[0] is trace_state:
+            return cached[1]
+        header = ",".join([f"{key}={value}" for key, value in trace_state.items()])
+        _TRACE_STATE_CACHE = (trace_state, header)
+        return header
 
     @property
     def attributes(self) -> Dict[str, Any]:
@@ -122,18 +162,25 @@ class Span:
         This property provides direct access to attributes dict.
         Changes are synced to OTel span via set_attribute().
         """
-        # Sync from OTel span if available (for processors that read directly)
-        if not self._ended and hasattr(self._otel_span, 'attributes'):
-            try:
-                otel_attrs = getattr(self._otel_span, 'attributes', {})
-                if otel_attrs:
-                    # Merge OTel attributes into local dict
-                    for k, v in otel_attrs.items():
-                        if k not in self._attributes:
-                            self._attributes[k] = v
-            except Exception:
-                pass
-        return self._attributes
+        attributes = self._attributes
+        if attributes is None:
+            # Callers may write through the returned dict, so hand out a real one
+            attributes = self._attributes = {}
+        if self._ended:
+            return attributes
+        # Sync from the OTel span, which also holds attributes set outside this
+        # wrapper (start_span(attributes=...), plain OTel instrumentation).
+        # Every local write goes to OTel too, so it can only hold keys we
+        # lack when it holds more keys than we do; otherwise skip the scan.
+        try:
+            otel_attrs = getattr(self._otel_span, 'attributes', None)
+            if otel_attrs and len(otel_attrs) > len(attributes):
+                for k, v in otel_attrs.items():
+                    if k not in attributes:
+                        attributes[k] = v
+        except Exception:
+            pass
+        return attributes
 
     @property
     def events(self) -> List[Dict[str, Any]]:
@@ -145,9 +192,10 @@ class Span:
     @property
     def duration_ns(self) -> Optional[int]:
         """Get span duration in nanoseconds."""
-        if self.end_time_ns is None:
+        end_time_ns = self.end_time_ns
+        if end_time_ns is None:
             return None
-        return self.end_time_ns - self.start_time_ns
+        return end_time_ns - self.start_time_ns
 
     def set_attribute(self, key: str, value: Any) -> None:
         """Set an attribute on the span."""
@@ -155,7 +203,23 @@ class Span:
             return
         
         # Store in local dict
-        self._attributes[key] = value
+        attributes = self._attributes
+        if attributes is None:
+            attributes = self._attributes = {}
+        else:
+            # Re-setting an unchanged value (e.g. defensively re-applied
+            # attributes) would only repeat OTel's locking and validation.
+            # Only same-typed scalars are compared, so True -> 1 changes go
+            # through and no arbitrary __eq__ runs here. Sequences may have
+            # been mutated in place, so re-setting one always reaches OTel.
+            value_type = type(value)
+            if value_type in _SCALAR_TYPES:
+                current = attributes.get(key, _MISSING)
+                if current is value or (
+                    type(current) is value_type and current == value
+                ):
+                    return
+        attributes[key] = value
         
         # Set on OTel span
         try:
@@ -163,6 +227,21 @@ class Span:
         except Exception:
             pass
 
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        """Set several attributes on the span in one call."""
+        if self._ended:
+            return
+        
+        if self._attributes is None:
+            self._attributes = dict(attributes)
+        else:
+            self._attributes.update(attributes)
+        
+        try:
+            self._otel_span.set_attributes(attributes)
+        except Exception:
+            pass
+
     def add_event(
         self,
         name: str,
@@ -230,7 +309,6 @@ class Span:
             self.status = SpanStatus.OK
             # Set status on OTel span as well
             try:
-                from opentelemetry.trace import Status, StatusCode
                 self._otel_span.set_status(Status(status_code=StatusCode.OK))
             except Exception:
                 pass
@@ -251,8 +329,7 @@ class Span:
     # Context manager support
     def __enter__(self) -> "Span":
         """Enter context manager."""
-        ctx = set_span_in_context(self._otel_span)
-        self._activation_token = context_api.attach(ctx)
+        self._activation_token = push_span(self)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> bool:
@@ -263,24 +340,15 @@ class Span:
             self.end()
         finally:
             if self._activation_token:
-                context_api.detach(self._activation_token)
+                pop_span(self._activation_token)
                 self._activation_token = None
         return False
 
+    # The async protocol does nothing asynchronous, so it shares the sync path
     async def __aenter__(self) -> "Span":
         """Enter async context manager."""
-        ctx = set_span_in_context(self._otel_span)
-        self._activation_token = context_api.attach(ctx)
-        return self
+        return self.__enter__()
 
     async def __aexit__(self, exc_type, exc, tb) -> bool:
         """Exit async context manager."""
-        try:
-            if exc:
-                self.record_exception(exc)
-            self.end()
-        finally:
-            if self._activation_token:
-                context_api.detach(self._activation_token)
-                self._activation_token = None
-        return False
+        return self.__exit__(exc_type, exc, tb)
@@ -1,10 +1,15 @@
 """Immutable trace metadata."""
 
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# One SpanContext is built per span; slots drop the per-instance __dict__
+# where dataclasses support them (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class SpanContext:
     trace_id: str
     span_id: str
@@ -13,4 +18,3 @@ class SpanContext:
 
     def is_valid(self) -> bool:
         return bool(self.trace_id and self.span_id)
-
@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import logging
+import sys
 from typing import Any, Dict, Optional
 
+from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 from opentelemetry.trace import Tracer as OTelTracer
+from opentelemetry.trace import NonRecordingSpan, SpanContext as OTelSpanContext, TraceFlags
+from opentelemetry.trace import get_current_span as otel_get_current_span
 from opentelemetry.trace import set_span_in_context
 from opentelemetry import context as context_api
 
 from traccia import runtime_config
+from traccia.context.propagators import _traccia_to_otel_context
+from traccia.tracer.span import Span
+from traccia.utils.helpers import format_span_id
+
+logger = logging.getLogger(__name__)
+
+_id_generator = RandomIdGenerator()
+_NOT_SAMPLED = TraceFlags(0)
 
 
 class Tracer:
@@ -51,62 +64,45 @@ class Tracer:
         Returns:
             Traccia Span instance (wraps OTel Span)
         """
-        from opentelemetry.trace import get_current_span
-        
         # Determine parent context
         otel_parent_context = None
         parent_span_id = None
         
-        if parent:
-            # Extract parent span ID for Traccia compatibility
-            if hasattr(parent, 'context'):
-                parent_span_id = parent.context.span_id
-            
-            # Get OTel span from parent
-            if hasattr(parent, '_otel_span'):
-                otel_parent_context = set_span_in_context(parent._otel_span)
-            elif hasattr(parent, 'get_span_context'):
-                # Direct OTel span
-                otel_parent_context = set_span_in_context(parent)
-                from traccia.utils.helpers import format_span_id
-                parent_span_id = format_span_id(parent.get_span_context().span_id)
-        
-        elif parent_context:
-            # Convert Traccia SpanContext to OTel context
-            if hasattr(parent_context, 'trace_id'):
-                from traccia.utils.helpers import parse_trace_id, parse_span_id
-                from opentelemetry.trace import SpanContext as OTelSpanContext, TraceFlags, TraceState, NonRecordingSpan
-                
-                trace_id = parse_trace_id(parent_context.trace_id)
-                span_id = parse_span_id(parent_context.span_id)
-                trace_flags = TraceFlags(parent_context.trace_flags)
-                
-                # Parse trace_state
-                trace_state = None
-                if parent_context.trace_state:
-                    from traccia.context.propagators import parse_tracestate
-                    parsed = parse_tracestate(parent_context.trace_state)
-                    if parsed:
-                        items = [(k, v) for k, v in parsed.items()]
-                        trace_state = TraceState(items)
-                
-                otel_span_context = OTelSpanContext(
-                    trace_id=trace_id,
-                    span_id=span_id,
-                    is_remote=False,
-                    trace_flags=trace_flags,
-                    trace_state=trace_state or TraceState(),
-                )
-                otel_parent_context = set_span_in_context(NonRecordingSpan(otel_span_context))
-                parent_span_id = parent_context.span_id
-        
-        # If no parent specified, use current span
-        if otel_parent_context is None:
-            current_span = get_current_span()
-            if current_span and current_span.get_span_context().is_valid:
+        if parent is None and parent_context is None:
+            # Common case: the parent is whatever span is current
+            current_span = otel_get_current_span()
+            current_span_context = current_span.get_span_context()
+            if current_span_context.is_valid:
                 otel_parent_context = set_span_in_context(current_span)
-                from traccia.utils.helpers import format_span_id
-                parent_span_id = format_span_id(current_span.get_span_context().span_id)
+                parent_span_id = format_span_id(current_span_context.span_id)
+        else:
+            if parent:
+                # Extract parent span ID for Traccia compatibility
+                if hasattr(parent, 'context'):
+                    parent_span_id = parent.context.span_id
+                
+                # Get OTel span from parent
+                if hasattr(parent, '_otel_span'):
+                    otel_parent_context = set_span_in_context(parent._otel_span)
+                elif hasattr(parent, 'get_span_context'):
+                    # Direct OTel span
+                    otel_parent_context = set_span_in_context(parent)
+                    parent_span_id = format_span_id(parent.get_span_context().span_id)
+            
+            elif parent_context:
+                # Convert Traccia SpanContext to OTel context
+                if hasattr(parent_context, 'trace_id'):
+                    otel_span_context = _traccia_to_otel_context(parent_context)
+                    otel_parent_context = set_span_in_context(NonRecordingSpan(otel_span_context))
+                    parent_span_id = parent_context.span_id
+            
+            # The explicit parent gave no OTel context: fall back to the current span
+            if otel_parent_context is None:
+                current_span = otel_get_current_span()
+                current_span_context = current_span.get_span_context()
+                if current_span_context.is_valid:
+                    otel_parent_context = set_span_in_context(current_span)
+                    parent_span_id = format_span_id(current_span_context.span_id)
         
         # Handle sampling
         sampler = getattr(self._provider, "sampler", None)
@@ -116,18 +112,11 @@ class Tracer:
                 sampled = bool(sampler.should_sample().sampled)
                 if not sampled:
                     # Create a non-recording span for unsampled traces
-                    from opentelemetry.trace import NonRecordingSpan, SpanContext, TraceFlags
-                    from opentelemetry.trace.id_generator import RandomIdGenerator
-                    
-                    id_generator = RandomIdGenerator()
-                    trace_id = id_generator.generate_trace_id()
-                    span_id = id_generator.generate_span_id()
-                    
-                    unsampled_context = SpanContext(
-                        trace_id=trace_id,
-                        span_id=span_id,
+                    unsampled_context = OTelSpanContext(
+                        trace_id=_id_generator.generate_trace_id(),
+                        span_id=_id_generator.generate_span_id(),
                         is_remote=False,
-                        trace_flags=TraceFlags(0),  # Not sampled
+                        trace_flags=_NOT_SAMPLED,
                     )
                     unsampled_span = NonRecordingSpan(unsampled_context)
                     otel_parent_context = set_span_in_context(unsampled_span)
@@ -138,8 +127,9 @@ class Tracer:
         if otel_parent_context is None and runtime_config.get_debug():
             pass  # OTel will handle this
         
-        # Check for auto-trace conflict
-        self._check_auto_trace_conflict(name, otel_parent_context)
+        # Check for auto-trace conflict (only possible for a new root span)
+        if otel_parent_context is None:
+            self._check_auto_trace_conflict(name, otel_parent_context)
         
         # Start OTel span
         otel_span = self._otel_tracer.start_span(
@@ -149,7 +139,6 @@ class Tracer:
         )
         
         # Wrap in Traccia Span
-        from traccia.tracer.span import Span
         return Span(otel_span, self, parent_span_id)
 
     def start_as_current_span(
@@ -180,10 +169,8 @@ class Tracer:
 
     def get_current_span(self) -> Optional["Span"]:
         """Get the current span."""
-        from opentelemetry.trace import get_current_span
-        otel_span = get_current_span()
+        otel_span = otel_get_current_span()
         if otel_span and otel_span.get_span_context().is_valid:
-            from traccia.tracer.span import Span
             # Check if we already have a Traccia wrapper
             if hasattr(otel_span, '_traccia_tracer'):
                 # Try to return existing wrapper (best effort)
@@ -201,25 +188,27 @@ class Tracer:
             span_name: Name of the span being created
             parent_context: Parent context (if None, this might be a root span)
         """
-        # Import here to avoid circular dependency
-        from traccia import auto
+        # Cheapest checks first: this runs for every new root span.
         
-        # Only warn if auto-trace is active
-        if not auto._auto_trace_context:
+        # Only warn if this would be a root span (no parent context)
+        # Note: If parent_context exists, this is a child span and that's expected
+        if parent_context is not None:
             return
         
         # Only warn if span name is exactly "root" (case-insensitive) to avoid false positives
-        # This helps users who might be migrating from manual root span creation
-        if span_name.lower() != "root":
+        # This helps users who might be migrating from manual root span creation.
+        # The length test avoids lower()'s string copy for every other name.
+        if len(span_name) != 4 or span_name.lower() != "root":
             return
         
-        # Only warn if this would be a root span (no parent context)
-        # Note: If parent_context exists, this is a child span and that's expected
-        if parent_context is not None:
+        # traccia.auto is imported lazily; if nothing has loaded it yet, no
+        # auto-trace can be active (and importing it here would be costly)
+        auto = sys.modules.get("traccia.auto")
+        
+        # Only warn if auto-trace is active
+        if auto is None or not auto._auto_trace_context:
             return
         
-        import logging
-        logger = logging.getLogger(__name__)
         logger.debug(
             f"Auto-started trace '{auto._auto_trace_name}' is active. "
             f"Created span '{span_name}' will be a child of the auto-started trace. "
@@ -235,7 +224,12 @@ class Tracer:
         Args:
             span: Traccia Span instance (still mutable)
         """
-        for processor in self._provider._enrichment_processors:
+        # A tuple the provider replaces on add, so this one read is a stable
+        # snapshot; most setups have none, so skip the loop entirely
+        processors = self._provider._enrichment_processors
+        if not processors:
+            return
+        for processor in processors:
             try:
                 processor.on_end(span)
             except Exception:
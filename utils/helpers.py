@@ -1,8 +1,9 @@
-"""Helper functions for OpenTelemetry compatibility."""
+"""Helper functions for OpenTelemetry compatibility and model-name lookups."""
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from opentelemetry.trace import Span as OTelSpan
 
@@ -49,7 +50,8 @@ def format_trace_id(trace_id: int) -> str:
     Returns:
         32-character hex string
     """
-    return format(trace_id, '032x')
+    # to_bytes().hex() is done entirely in C, without format-spec parsing
+    return trace_id.to_bytes(16, "big").hex()
 
 
 def format_span_id(span_id: int) -> str:
@@ -62,13 +64,16 @@ def format_span_id(span_id: int) -> str:
     Returns:
         16-character hex string
     """
-    return format(span_id, '016x')
+    return span_id.to_bytes(8, "big").hex()
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_trace_id(hex_string: str) -> int:
     """
     Parse hex string trace_id to OTel int64.
     
+    Cached because every span of a trace carries the same trace_id.
+    
     Args:
         hex_string: 32-character hex string
     
@@ -93,3 +98,44 @@ def parse_span_id(hex_string: str) -> int:
     if not hex_string:
         return 0
     return int(hex_string, 16)
+
+
+def set_span_attributes(span: Any, attributes: Dict[str, Any]) -> None:
+    """Write several attributes in one call when the span supports it."""
+    set_attributes = getattr(span, "set_attributes", None)
+    if set_attributes is not None:
+        set_attributes(attributes)
+        return
+    for key, value in attributes.items():
+        span.set_attribute(key, value)
+
+
+PrefixIndex = Tuple[int, Dict[str, Tuple[Tuple[str, Any], ...]]]
+
+
+def build_prefix_index(items: Iterable[Tuple[str, Any]]) -> PrefixIndex:
+    """
+    Build a longest-prefix-match index from (prefix, value) pairs.
+    
+    Prefixes are bucketed by their first `width` characters, where width is the
+    length of the shortest prefix. Any prefix of a name shares the name's first
+    `width` characters, so a lookup is one dict hit plus a scan of a (usually
+    one- or two-entry) bucket ordered longest-first.
+    """
+    ordered = sorted(items, key=lambda item: len(item[0]), reverse=True)
+    if not ordered:
+        return 0, {}
+    width = len(ordered[-1][0])
+    buckets: Dict[str, list] = {}
+    for prefix, value in ordered:
+        buckets.setdefault(prefix[:width], []).append((prefix, value))
+    return width, {head: tuple(bucket) for head, bucket in buckets.items()}
+
+
+def match_longest_prefix(name: str, index: PrefixIndex) -> Optional[Any]:
+    """Return the value for the longest prefix of `name` in the index, or None."""
+    width, buckets = index
+    for prefix, value in buckets.get(name[:width], ()):
+        if name.startswith(prefix):
+            return value
+    return None